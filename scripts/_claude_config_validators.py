@@ -0,0 +1,41 @@
+# Generated by validate_claude_config.py --generate; do not edit.
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate_config(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'mcpServers': {'type': 'object'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "mcpServers" in data_keys:
+            data_keys.remove("mcpServers")
+            data__mcpServers = data["mcpServers"]
+            if not isinstance(data__mcpServers, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".mcpServers must be object", value=data__mcpServers, name="" + (name_prefix or "data") + ".mcpServers", definition={'type': 'object'}, rule='type')
+    return data
+
+def validate_server(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['command', 'args'], 'properties': {'command': {'type': 'string'}, 'args': {'type': 'array'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['command', 'args']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['command', 'args'], 'properties': {'command': {'type': 'string'}, 'args': {'type': 'array'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "command" in data_keys:
+            data_keys.remove("command")
+            data__command = data["command"]
+            if not isinstance(data__command, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".command must be string", value=data__command, name="" + (name_prefix or "data") + ".command", definition={'type': 'string'}, rule='type')
+        if "args" in data_keys:
+            data_keys.remove("args")
+            data__args = data["args"]
+            if not isinstance(data__args, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".args must be array", value=data__args, name="" + (name_prefix or "data") + ".args", definition={'type': 'array'}, rule='type')
+    return data
@@ -2,46 +2,77 @@
 """Test script to verify MCP server connection"""
 
 import asyncio
-import json
+import os
 import sys
+import time
+
+from system_diagnostics_mcp.serialization import loads
 from system_diagnostics_mcp.server import SystemDiagnosticsServer
 
 
+async def _timed(coro):
+    """Await a server call and return its result with the elapsed time in ms"""
+    start = time.perf_counter_ns()
+    result = await coro
+    return result, (time.perf_counter_ns() - start) / 1e6
+
+
+def _emit(lines) -> None:
+    """Write the report to stdout as one bytes buffer, bypassing TextIOWrapper"""
+    text = "\n".join(lines) + "\n"
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError):  # stdout replaced, e.g. captured
+        sys.stdout.write(text)
+        return
+    sys.stdout.flush()
+    buf = memoryview(text.encode("utf-8"))
+    while buf:
+        buf = buf[os.write(fd, buf):]
+
+
 async def test_server():
     """Test basic server functionality"""
-    print("Testing System Diagnostics MCP Server...")
-    print("-" * 40)
+    # Collect the report and emit it with a single write once the run ends
+    out = ["Testing System Diagnostics MCP Server...", "-" * 40]
     
     try:
         server = SystemDiagnosticsServer()
-        print("✓ Server initialized successfully")
+        out.append("✓ Server initialized successfully")
+        
+        # The three calls are independent, so submit them together
+        out.append("\nTesting get_system_info, get_cpu_metrics and get_memory_metrics...")
+        (sys_r, sys_ms), (cpu_r, cpu_ms), (mem_r, mem_ms) = await asyncio.gather(
+            _timed(server.get_system_info({})),
+            _timed(server.get_cpu_metrics({})),
+            _timed(server.get_memory_metrics({})),
+        )
         
         # Test system info
-        print("\nTesting get_system_info...")
-        result = await server.get_system_info({})
-        data = json.loads(result[0].text)
-        print(f"✓ OS Type: {data['system_info']['os_type']}")
-        print(f"✓ Hostname: {data['system_info']['hostname']}")
-        print(f"✓ CPU Cores: {data['system_info']['logical_cores']}")
-        print(f"✓ RAM: {data['system_info']['total_ram_gb']} GB")
+        data = loads(sys_r[0].text)
+        out.append(f"✓ OS Type: {data['system_info']['os_type']}")
+        out.append(f"✓ Hostname: {data['system_info']['hostname']}")
+        out.append(f"✓ CPU Cores: {data['system_info']['logical_cores']}")
+        out.append(f"✓ RAM: {data['system_info']['total_ram_gb']} GB")
+        out.append(f"✓ get_system_info took {sys_ms:.1f} ms")
         
         # Test CPU metrics
-        print("\nTesting get_cpu_metrics...")
-        result = await server.get_cpu_metrics({"interval": 1})
-        data = json.loads(result[0].text)
-        print(f"✓ CPU Usage: {data['usage_percent']}%")
+        data = loads(cpu_r[0].text)
+        out.append(f"✓ CPU Usage: {data['usage_percent']}%")
+        out.append(f"✓ get_cpu_metrics took {cpu_ms:.1f} ms")
         
         # Test memory metrics
-        print("\nTesting get_memory_metrics...")
-        result = await server.get_memory_metrics({})
-        data = json.loads(result[0].text)
-        print(f"✓ Memory Usage: {data['virtual_memory']['percent']}%")
+        data = loads(mem_r[0].text)
+        out.append(f"✓ Memory Usage: {data['virtual_memory']['percent']}%")
+        out.append(f"✓ get_memory_metrics took {mem_ms:.1f} ms")
         
-        print("\n" + "=" * 40)
-        print("All tests passed successfully!")
-        print("The server is ready to use with Claude Desktop.")
+        out.append("\n" + "=" * 40)
+        out.append("All tests passed successfully!")
+        out.append("The server is ready to use with Claude Desktop.")
+        _emit(out)
         
     except Exception as e:
+        _emit(out)
         print(f"✗ Error: {e}", file=sys.stderr)
         return 1
     
@@ -49,5 +80,12 @@ async def test_server():
 
 
 if __name__ == "__main__":
+    # uvloop has lower per-await overhead than the default loop; it isn't
+    # available on Windows, where the default ProactorEventLoop is kept
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     exit_code = asyncio.run(test_server())
     sys.exit(exit_code)
\ No newline at end of file
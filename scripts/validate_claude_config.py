@@ -1,46 +1,221 @@
 import json
 import sys
 import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fastjsonschema
+except ImportError:  # A dev extra; fall back to manual key checks
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    import json as orjson
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # Large configs are parsed in full instead
+    ijson = None
+
+_PARSE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+if ijson is not None:
+    _PARSE_ERRORS += (ijson.JSONError,)
+
+# Configs above this size are streamed so only mcpServers gets materialized;
+# below it a full orjson parse is faster than ijson's per-event overhead
+_STREAM_THRESHOLD = 64 * 1024
+
+# Each entry under mcpServers must at least say how to launch the server
+_REQUIRED = frozenset({"command", "args"})
+
+_SERVER_SCHEMA = {
+    "type": "object",
+    "required": ["command", "args"],
+    "properties": {
+        "command": {"type": "string"},
+        "args": {"type": "array"}
+    }
+}
+
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "mcpServers": {"type": "object"}
+    }
+}
+
+# APPDATA only exists on Windows; elsewhere this resolves to a relative path
+# that simply won't be found
+_CONFIG_PATH: Path = Path(os.environ.get("APPDATA", "")) / "Claude" / "claude_desktop_config.json"
+
+_GENERATED_MODULE = Path(__file__).with_name("_claude_config_validators.py")
+
+
+def generate_validators():
+    """Write the schema validators out as plain Python source
+
+    fastjsonschema emits one module per schema, each defining ``validate``;
+    the shared imports are kept once and each function is renamed so both
+    validators live in a single importable module.
+    """
+    if fastjsonschema is None:
+        sys.exit("--generate requires fastjsonschema (pip install fastjsonschema)")
+    header = None
+    functions = []
+    for name, schema in (("validate_config", _CONFIG_SCHEMA), ("validate_server", _SERVER_SCHEMA)):
+        code = fastjsonschema.compile_to_code(schema)
+        prefix, _, body = code.partition("def validate(")
+        header = header or prefix
+        functions.append(f"def {name}(" + body)
+    source = (
+        "# Generated by validate_claude_config.py --generate; do not edit.\n"
+        + header
+        + "\n\n".join(functions)
+        + "\n"
+    )
+    _GENERATED_MODULE.write_text(source, encoding="utf-8")
+
+
+class _SchemaError(ValueError):
+    """Raised by the manual checks used when fastjsonschema isn't installed"""
+    
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+def _check_config(config):
+    """Manual equivalent of the _CONFIG_SCHEMA validator"""
+    if not isinstance(config, dict):
+        raise _SchemaError("data must be object")
+    if "mcpServers" in config and not isinstance(config["mcpServers"], dict):
+        raise _SchemaError("data.mcpServers must be object")
+    return config
+
+
+def _check_server(server_config):
+    """Manual equivalent of the _SERVER_SCHEMA validator"""
+    if not isinstance(server_config, dict):
+        raise _SchemaError("data must be object")
+    if not _REQUIRED.issubset(server_config):
+        raise _SchemaError("data must contain ['command', 'args'] properties")
+    if not isinstance(server_config["command"], str):
+        raise _SchemaError("data.command must be string")
+    if not isinstance(server_config["args"], list):
+        raise _SchemaError("data.args must be array")
+    return server_config
+
+
+# Prefer the pre-generated validators so no schema compilation happens at
+# startup; compile in-process if the generated module is missing, and check
+# by hand when fastjsonschema isn't installed at all (the generated module
+# imports its exception types)
+if fastjsonschema is None:
+    _VALIDATE = _check_config
+    _VALIDATE_SERVER = _check_server
+    _SCHEMA_ERRORS = (_SchemaError,)
+else:
+    try:
+        from _claude_config_validators import validate_config as _VALIDATE
+        from _claude_config_validators import validate_server as _VALIDATE_SERVER
+    except ImportError:
+        _VALIDATE = fastjsonschema.compile(_CONFIG_SCHEMA)
+        _VALIDATE_SERVER = fastjsonschema.compile(_SERVER_SCHEMA)
+    _SCHEMA_ERRORS = (fastjsonschema.JsonSchemaException,)
+
+def _load_config() -> Optional[dict]:
+    """Read the config file, streaming just mcpServers out of large ones"""
+    if ijson is None or _CONFIG_PATH.stat().st_size <= _STREAM_THRESHOLD:
+        return orjson.loads(_CONFIG_PATH.read_bytes())
+    
+    # Walk every event to EOF so a syntax error anywhere in the document is
+    # raised, but only build the top-level mcpServers value
+    root_event = None
+    servers = None
+    builder = None
+    depth = 0
+    with open(_CONFIG_PATH, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if root_event is None:
+                root_event = event
+            if builder is not None:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                    if not depth:
+                        servers, builder = builder.value, None
+            elif prefix == "mcpServers":
+                if event in ("start_map", "start_array"):
+                    builder = ObjectBuilder()
+                    builder.event(event, value)
+                    depth = 1
+                else:
+                    servers = value
+    if root_event != "start_map":
+        # Not an object; let the config validator report it as the
+        # in-memory path would
+        return None
+    return {} if servers is None else {"mcpServers": servers}
+
 
 def validate_claude_config():
     """Validate Claude Desktop configuration file"""
-    config_path = os.path.expandvars(r'%APPDATA%\Claude\claude_desktop_config.json')
-    
+    # Collect the report and emit it with a single write
+    out = []
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _load_config()
         
-        print("✅ JSON is valid!")
+        out.append("✅ JSON is valid!")
+        
+        _VALIDATE(config)
         
         if 'mcpServers' in config:
             servers = list(config['mcpServers'].keys())
-            print(f"✅ MCP Servers configured: {servers}")
+            out.append(f"✅ MCP Servers configured: {servers}")
             
             for server_name, server_config in config['mcpServers'].items():
-                required_fields = ['command', 'args']
-                missing_fields = [field for field in required_fields if field not in server_config]
-                
-                if missing_fields:
-                    print(f"⚠️  {server_name}: Missing required fields: {missing_fields}")
+                try:
+                    _VALIDATE_SERVER(server_config)
+                except _SCHEMA_ERRORS as e:
+                    # The validator stops at the first error; report every
+                    # missing field at once so they can all be fixed together
+                    missing = _REQUIRED.difference(server_config) if isinstance(server_config, dict) else None
+                    if missing:
+                        out.append(f"⚠️  {server_name}: Missing required fields: {sorted(missing)}")
+                    else:
+                        out.append(f"⚠️  {server_name}: {e.message}")
                 else:
-                    print(f"✅ {server_name}: Configuration looks good")
+                    out.append(f"✅ {server_name}: Configuration looks good")
         else:
-            print("⚠️  No mcpServers section found")
+            out.append("⚠️  No mcpServers section found")
             
         return True
         
-    except json.JSONDecodeError as e:
-        print(f"❌ JSON Parse Error: {e}")
+    except _PARSE_ERRORS as e:
+        out.append(f"❌ JSON Parse Error: {e}")
+        return False
+    except _SCHEMA_ERRORS as e:
+        out.append(f"❌ Schema Error: {e.message}")
         return False
     except FileNotFoundError:
-        print(f"❌ Configuration file not found: {config_path}")
+        out.append(f"❌ Configuration file not found: {_CONFIG_PATH}")
         return False
     except Exception as e:
-        print(f"❌ Error: {e}")
+        out.append(f"❌ Error: {e}")
         return False
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
+    if "--generate" in sys.argv[1:]:
+        generate_validators()
+        sys.exit(0)
     if validate_claude_config():
         sys.exit(0)
     else:
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -1,7 +1,19 @@
-from setuptools import setup, find_packages
+import sys
+from pathlib import Path
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+from setuptools import setup
+
+# Only commands that publish metadata need the README; skip reading it for
+# egg_info/develop runs. pyproject.toml builds go through hatchling, which
+# already defers reading the readme to metadata generation.
+NEEDS_LONG_DESCRIPTION = any(
+    cmd in sys.argv for cmd in ("sdist", "bdist_wheel", "bdist", "upload", "check")
+)
+long_description = (
+    Path(__file__).with_name("README.md").read_text(encoding="utf-8")
+    if NEEDS_LONG_DESCRIPTION
+    else ""
+)
 
 setup(
     name="system-diagnostics-mcp",
@@ -12,7 +24,14 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/system-diagnostics-mcp",
-    packages=find_packages(),
+    # Listed explicitly so setup() doesn't walk the source tree on every build
+    packages=[
+        "system_diagnostics_mcp",
+        "system_diagnostics_mcp.analyzers",
+        "system_diagnostics_mcp.monitors",
+        "system_diagnostics_mcp.utils",
+    ],
+    include_package_data=True,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -29,10 +48,20 @@ setup(
     install_requires=[
         "mcp>=0.9.0",
         "psutil>=5.9.0",
+        "orjson>=3.10.0",
     ],
     extras_require={
         "windows": ["wmi>=1.5.1", "pywin32>=306"],
-        "dev": ["pytest>=7.4.0", "pytest-asyncio>=0.21.0", "black>=23.0.0", "mypy>=1.5.0"],
+        "sse": ["uvicorn>=0.23", "starlette>=0.27"],
+        "dev": [
+            "pytest>=7.4.0",
+            "pytest-asyncio>=0.21.0",
+            "black>=23.0.0",
+            "mypy>=1.5.0",
+            "fastjsonschema>=2.18",
+            "ijson>=3.2",
+            "uvloop>=0.19; platform_system!='Windows'",
+        ],
     },
     entry_points={
         "console_scripts": [
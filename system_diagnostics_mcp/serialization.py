@@ -0,0 +1,34 @@
+"""JSON serialization helpers
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both paths produce the same indented output.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    # Option masks built once; non-string keys (e.g. core numbers) are
+    # stringified as json.dumps does
+    _INDENTED = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    _COMPACT = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any, indent: bool = True) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, option=_INDENTED if indent else _COMPACT).decode()
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+except ImportError:
+    import json
+
+    def dumps(obj: Any, indent: bool = True) -> str:
+        """Serialize obj to a JSON string"""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+__all__ = ["dumps", "loads", "JSONDecodeError"]
@@ -5,15 +5,28 @@ A comprehensive system monitoring and diagnostics server for the Model Context P
 Provides detailed system metrics, application monitoring, and AI-powered recommendations.
 """
 
-import json
 import platform
 import asyncio
+import csv
+import re
+import socket
+import struct
 import logging
 import sys
 import os
 import subprocess
+import heapq
+import importlib.util
+import shutil
+import io
+import mmap
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from xml.etree import ElementTree
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
@@ -26,12 +39,7 @@ from mcp.server.models import InitializationOptions
 # System monitoring libraries
 import psutil  # Cross-platform system monitoring
 
-# Platform-specific imports
-if platform.system() == "Windows":
-    import wmi
-    import winreg
-elif platform.system() == "Darwin":  # macOS
-    import plistlib
+from .serialization import dumps, loads
 
 # Configure logging
 logging.basicConfig(
@@ -40,6 +48,747 @@ logging.basicConfig(
 )
 logger = logging.getLogger("system_diagnostics_mcp")
 
+# Non-blocking CPU usage samples younger than this are reused as-is
+CPU_SAMPLE_MAX_AGE = 0.2
+
+# Shortest window the default (no interval) CPU reading is measured over
+CPU_MIN_WINDOW = 0.5
+
+# Pause between the priming and the real per-process cpu_percent reading
+PROC_CPU_WARMUP = 0.1
+
+# Single-letter states from /proc/<pid>/stat, named as psutil reports them
+LINUX_PROC_STATES = {
+    "R": "running", "S": "sleeping", "D": "disk-sleep", "Z": "zombie",
+    "T": "stopped", "t": "tracing-stop", "X": "dead", "I": "idle",
+    "P": "parked", "W": "waking", "K": "wake-kill"
+}
+
+# Display names for address families and socket types; str() on the enums
+# is slow and its output differs between Python versions
+FAMILY_NAMES = {
+    socket.AF_INET: "AF_INET",
+    socket.AF_INET6: "AF_INET6",
+    psutil.AF_LINK: "AF_LINK",
+}
+SOCKET_TYPES = {
+    socket.SOCK_STREAM: "SOCK_STREAM",
+    socket.SOCK_DGRAM: "SOCK_DGRAM",
+}
+
+# At most this many connections are reported by get_network_metrics
+CONNECTION_LIMIT = 50
+
+# The kernel truncates the comm field of /proc/<pid>/stat to this many
+# characters; names that long are completed from the command line
+LINUX_COMM_LEN = 15
+
+# Socket states as encoded in /proc/net/tcp{,6}, named as psutil reports them
+LINUX_TCP_STATES = {
+    "01": "ESTABLISHED", "02": "SYN_SENT", "03": "SYN_RECV", "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2", "06": "TIME_WAIT", "07": "CLOSE", "08": "CLOSE_WAIT",
+    "09": "LAST_ACK", "0A": "LISTEN", "0B": "CLOSING"
+}
+
+# Uninstall registry key and the values reported from it by
+# get_installed_applications on Windows
+UNINSTALL_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+UNINSTALL_VALUES = frozenset({"DisplayName", "DisplayVersion", "Publisher", "InstallDate"})
+
+# winreg REG_SZ and REG_EXPAND_SZ (literal so the module imports everywhere)
+STRING_VALUE_TYPES = frozenset({1, 2})
+
+# Threads used to read Uninstall registry entries concurrently
+REGISTRY_WORKERS = 8
+
+# dpkg's package database, and the fields read from each of its stanzas
+# (Description keeps only its first, summary line)
+DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+DPKG_FIELD_RE = re.compile(rb"^(Package|Version|Status|Description):[ \t]*(.*)$", re.M)
+
+# Journal fields read by the Linux log reader (__REALTIME_TIMESTAMP is always sent)
+JOURNAL_FIELDS = "PRIORITY,_SYSTEMD_UNIT,MESSAGE"
+
+# A syslog file line: traditional ("Jan  2 03:04:05") or RFC 3339 timestamp,
+# host, tag and message
+SYSLOG_LINE_RE = re.compile(
+    r"^(\w{3}\s+\d+\s+[\d:]+|\d{4}-\d\d-\d\dT\S+)\s+(\S+)\s+([^:]+):\s*(.*)$"
+)
+
+# XML namespace of Windows event records rendered by wevtutil
+EVENT_NS = "{http://schemas.microsoft.com/win/2004/08/events/event}"
+
+# Registry key holding the SMBIOS board and BIOS strings on Windows
+BIOS_REGISTRY_KEY = r"HARDWARE\DESCRIPTION\System\BIOS"
+
+# WMI classes read by the Windows hardware collectors and the properties
+# taken from each; results are cached as plain dicts for HARDWARE_TTL
+WMI_PROPERTIES = {
+    "Win32_BaseBoard": ("Manufacturer", "Product", "Version", "SerialNumber", "ConfigOptions"),
+    "Win32_BIOS": ("Manufacturer", "Version", "ReleaseDate", "SMBIOSBIOSVersion", "BiosCharacteristics"),
+    "Win32_PhysicalMemory": ("Description", "Capacity", "Speed", "Manufacturer", "PartNumber",
+                             "FormFactor", "MemoryType"),
+    "Win32_Processor": ("SocketDesignation", "Manufacturer"),
+    "Win32_ComputerSystem": ("Manufacturer", "Model", "Name", "Domain", "Workgroup",
+                             "TotalPhysicalMemory", "SystemType", "PCSystemType"),
+    "Win32_SystemEnclosure": ("ChassisTypes", "SerialNumber", "SMBIOSAssetTag"),
+    "Win32_ComputerSystemProduct": ("UUID", "IdentifyingNumber", "SKUNumber", "Version"),
+    "Win32_DiskDrive": ("DeviceID", "MediaType"),
+}
+
+# PowerShell used when pywin32's wmi module is unavailable: a single
+# Get-CimInstance pass over every class in WMI_PROPERTIES, emitted as one
+# JSON object of instance lists. CIM returns ReleaseDate as a DateTime, which
+# is formatted here to keep the value a plain string
+CIM_SELECT_OVERRIDES = {
+    "ReleaseDate": "@{n='ReleaseDate';e={if ($_.ReleaseDate) {$_.ReleaseDate.ToString('yyyy-MM-dd')}}}"
+}
+CIM_SCRIPT = "@{" + "; ".join(
+    f"'{wmi_class}' = @(Get-CimInstance {wmi_class} | Select-Object "
+    + ",".join(CIM_SELECT_OVERRIDES.get(name, name) for name in properties) + ")"
+    for wmi_class, properties in WMI_PROPERTIES.items()
+) + "} | ConvertTo-Json -Depth 4 -Compress"
+
+# SMBIOS memory form factor and memory type codes, as reported by WMI
+MEMORY_FORM_FACTORS = {
+    0: "Unknown",
+    1: "Other",
+    2: "SIP",
+    3: "DIP",
+    4: "ZIP",
+    5: "SOJ",
+    6: "Proprietary",
+    7: "SIMM",
+    8: "DIMM",
+    9: "TSOP",
+    10: "PGA",
+    11: "RIMM",
+    12: "SODIMM",
+    13: "SRIMM",
+    14: "SMD",
+    15: "SSMP",
+    16: "QFP",
+    17: "TQFP",
+    18: "SOIC",
+    19: "LCC",
+    20: "PLCC",
+    21: "BGA",
+    22: "FPBGA",
+    23: "LGA"
+}
+MEMORY_TYPES = {
+    0: "Unknown",
+    1: "Other",
+    2: "DRAM",
+    3: "Synchronous DRAM",
+    4: "Cache DRAM",
+    5: "EDO",
+    6: "EDRAM",
+    7: "VRAM",
+    8: "SRAM",
+    9: "RAM",
+    10: "ROM",
+    11: "Flash",
+    12: "EEPROM",
+    13: "FEPROM",
+    14: "EPROM",
+    15: "CDRAM",
+    16: "3DRAM",
+    17: "SDRAM",
+    18: "SGRAM",
+    19: "RDRAM",
+    20: "DDR",
+    21: "DDR2",
+    22: "DDR2 FB-DIMM",
+    24: "DDR3",
+    25: "FBD2",
+    26: "DDR4",
+    27: "LPDDR",
+    28: "LPDDR2",
+    29: "LPDDR3",
+    30: "LPDDR4"
+}
+
+# DMI strings the Linux kernel exports as files, and the files read for
+# each lookup, by the key they are reported under
+DMI_ID_DIR = "/sys/devices/virtual/dmi/id"
+# SMBIOS strings are at most 255 bytes, plus the newline sysfs appends
+DMI_ID_READ_SIZE = 256
+DMI_ID_BOARD_FILES = {
+    "manufacturer": "board_vendor",
+    "product": "board_name",
+    "version": "board_version",
+    "serial_number": "board_serial"
+}
+DMI_ID_BIOS_FILES = {
+    "vendor": "bios_vendor",
+    "version": "bios_version",
+    "release_date": "bios_date"
+}
+DMI_ID_SYSTEM_FILES = {
+    "manufacturer": "sys_vendor",
+    "model": "product_name",
+    "name": "product_version"
+}
+DMI_ID_SYSTEM_DETAIL_FILES = {
+    "serial_number": "product_serial",
+    "uuid": "product_uuid",
+    "sku_number": "product_sku",
+    "family": "product_family"
+}
+
+# SMBIOS structures exported by the Linux kernel (root-only), and the
+# encodings of the form factor and memory type fields of Memory Device
+# (type 17) records, which differ from the WMI codes above
+SMBIOS_ENTRIES_DIR = "/sys/firmware/dmi/entries"
+SMBIOS_FORM_FACTORS = {
+    1: "Other",
+    2: "Unknown",
+    3: "SIMM",
+    4: "SIP",
+    5: "Chip",
+    6: "DIP",
+    7: "ZIP",
+    8: "Proprietary Card",
+    9: "DIMM",
+    10: "TSOP",
+    11: "Row of chips",
+    12: "RIMM",
+    13: "SODIMM",
+    14: "SRIMM",
+    15: "FB-DIMM",
+    16: "Die",
+    17: "CAMM"
+}
+SMBIOS_MEMORY_TYPES = {
+    1: "Other",
+    2: "Unknown",
+    3: "DRAM",
+    4: "EDRAM",
+    5: "VRAM",
+    6: "SRAM",
+    7: "RAM",
+    8: "ROM",
+    9: "Flash",
+    10: "EEPROM",
+    11: "FEPROM",
+    12: "EPROM",
+    13: "CDRAM",
+    14: "3DRAM",
+    15: "SDRAM",
+    16: "SGRAM",
+    17: "RDRAM",
+    18: "DDR",
+    19: "DDR2",
+    20: "DDR2 FB-DIMM",
+    24: "DDR3",
+    25: "FBD2",
+    26: "DDR4",
+    27: "LPDDR",
+    28: "LPDDR2",
+    29: "LPDDR3",
+    30: "LPDDR4",
+    31: "Logical non-volatile device",
+    32: "HBM",
+    33: "HBM2",
+    34: "DDR5",
+    35: "LPDDR5",
+    36: "HBM3"
+}
+
+# Memory module properties requested from wmic
+MEMORYCHIP_FIELDS = "Capacity,Speed,Manufacturer,PartNumber,FormFactor,MemoryType"
+
+# Sections every motherboard and computer model collector fills in
+MOTHERBOARD_SECTIONS = ("basic_info", "bios_info", "memory_info", "capabilities")
+COMPUTER_MODEL_SECTIONS = ("basic_info", "system_details")
+
+# dmidecode fields kept from each section, by the key they are reported under
+DMI_BOARD_KEYS = {
+    "Manufacturer": "manufacturer",
+    "Product Name": "product",
+    "Version": "version",
+    "Serial Number": "serial_number"
+}
+DMI_BIOS_KEYS = {
+    "Vendor": "vendor",
+    "Version": "version",
+    "Release Date": "release_date"
+}
+DMI_SYSTEM_KEYS = {
+    "Manufacturer": "manufacturer",
+    "Product Name": "model",
+    "Version": "name"
+}
+DMI_SYSTEM_DETAIL_KEYS = {
+    "Serial Number": "serial_number",
+    "UUID": "uuid",
+    "SKU Number": "sku_number",
+    "Family": "family"
+}
+
+# system_profiler SPHardwareDataType fields used when its XML can't be parsed
+MAC_HARDWARE_KEYS = {
+    "Model Name": "model",
+    "Model Identifier": "name"
+}
+MAC_HARDWARE_DETAIL_KEYS = {
+    "Model Identifier": "model_identifier",
+    "Serial Number": "serial_number",
+    "Serial Number (system)": "serial_number",
+    "Hardware UUID": "hardware_uuid",
+    "Boot ROM Version": "boot_rom_version",
+    "SMC Version": "smc_version",
+    "SMC Version (system)": "smc_version",
+    "Processor Name": "cpu_type",
+    "Number of Processors": "number_processors",
+    "Memory": "physical_memory"
+}
+
+# macOS version record read instead of running system_profiler SPSoftwareDataType
+MACOS_VERSION_PLIST = "/System/Library/CoreServices/SystemVersion.plist"
+
+# Per-process readings from diagnose_performance younger than this are reused
+# by get_battery_status
+PROC_SNAPSHOT_MAX_AGE = 5
+
+# Cache lifetimes in seconds for slow-changing data (None never expires)
+PARTITIONS_TTL = 60
+DRIVE_TYPE_TTL = 3600
+APPLICATIONS_TTL = 3600
+HARDWARE_TTL = 30 * 60
+
+# Upgrade suggestions per use case for get_hardware_recommendations, as
+# (spec, minimum, recommendation): the recommendation applies when the spec
+# ("cpu_cores" or "ram_gb") is below minimum, or always when spec is None
+USE_CASE_RECOMMENDATIONS = {
+    "gaming": [
+        ("cpu_cores", 6, {
+            "component": "CPU",
+            "reason": "Gaming benefits from 6+ cores for modern titles",
+            "suggestion": "Consider AMD Ryzen 5 5600X or Intel Core i5-12600K"
+        }),
+        ("ram_gb", 16, {
+            "component": "RAM",
+            "reason": "16GB minimum recommended for gaming",
+            "suggestion": "Upgrade to 16GB DDR4 3200MHz or higher"
+        }),
+        (None, None, {
+            "component": "GPU",
+            "reason": "Graphics card is crucial for gaming performance",
+            "suggestion": "Consider RTX 4060 Ti or RX 7700 XT for 1080p/1440p gaming"
+        }),
+    ],
+    "content_creation": [
+        ("cpu_cores", 8, {
+            "component": "CPU",
+            "reason": "Content creation benefits from 8+ cores",
+            "suggestion": "Consider AMD Ryzen 7 5800X or Intel Core i7-12700K"
+        }),
+        ("ram_gb", 32, {
+            "component": "RAM",
+            "reason": "32GB+ recommended for video editing and 3D rendering",
+            "suggestion": "Upgrade to 32GB DDR4 3600MHz"
+        }),
+        (None, None, {
+            "component": "Storage",
+            "reason": "Fast storage crucial for large file handling",
+            "suggestion": "Add NVMe SSD (Samsung 980 Pro or WD Black SN850)"
+        }),
+    ],
+    "development": [
+        ("ram_gb", 16, {
+            "component": "RAM",
+            "reason": "16GB+ recommended for running VMs and containers",
+            "suggestion": "Upgrade to 16GB or 32GB DDR4"
+        }),
+        (None, None, {
+            "component": "Storage",
+            "reason": "Fast storage improves build times",
+            "suggestion": "NVMe SSD for OS and development tools"
+        }),
+    ],
+    "productivity": [
+        ("ram_gb", 8, {
+            "component": "RAM",
+            "reason": "8GB minimum for smooth multitasking",
+            "suggestion": "Upgrade to 8GB or 16GB DDR4"
+        }),
+        (None, None, {
+            "component": "Storage",
+            "reason": "SSD significantly improves system responsiveness",
+            "suggestion": "Replace HDD with SATA SSD (Samsung 870 EVO or Crucial MX500)"
+        }),
+    ],
+}
+
+NO_SSD_RECOMMENDATION = {
+    "component": "Storage",
+    "reason": "No SSD detected - SSD provides major performance improvement",
+    "suggestion": "Add 500GB+ NVMe or SATA SSD for OS and applications"
+}
+
+COMPATIBILITY_NOTES = (
+    "Check motherboard compatibility before purchasing RAM (DDR3/DDR4/DDR5)",
+    "Verify power supply wattage before GPU upgrade",
+    "Ensure motherboard has M.2 slot for NVMe SSDs",
+    "Consider case dimensions for GPU upgrades"
+)
+
+
+# Tool schemas are static; built once at import and shared by every server
+TOOLS = [
+    types.Tool(
+        name="get_system_info",
+        description="Get comprehensive system information including OS, hardware, and boot time",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_cpu_metrics",
+        description="Get detailed CPU metrics including usage, frequency, temperature (if available)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "per_core": {
+                    "type": "boolean",
+                    "description": "Return per-core statistics",
+                    "default": False
+                },
+                "interval": {
+                    "type": "number",
+                    "description": "Sampling interval in seconds. Omit to report usage since the previous reading (at least 0.5s) without blocking; 0 may reuse a reading from the last 200ms"
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_memory_metrics",
+        description="Get detailed memory usage including RAM, swap, and per-process memory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_processes": {
+                    "type": "boolean",
+                    "description": "Include top memory-consuming processes",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_storage_metrics",
+        description="Get storage information for all drives including SSDs, HDDs, and usage",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_io_stats": {
+                    "type": "boolean",
+                    "description": "Include I/O statistics",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_network_metrics",
+        description="Get network interface information and statistics",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_connections": {
+                    "type": "boolean",
+                    "description": "Include active network connections",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_processes",
+        description="Get information about running processes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sort_by": {
+                    "type": "string",
+                    "enum": ["cpu", "memory", "name", "pid"],
+                    "description": "Sort processes by this metric",
+                    "default": "cpu"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of processes to return",
+                    "default": 20
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_installed_applications",
+        description="Get list of installed applications on the system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Filter by application category",
+                    "default": "all"
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_battery_status",
+        description="Get battery status and power consumption information",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_system_logs",
+        description="Get recent system logs and events",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "log_type": {
+                    "type": "string",
+                    "enum": ["system", "application", "security", "all"],
+                    "description": "Type of logs to retrieve",
+                    "default": "system"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of log entries",
+                    "default": 100
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="diagnose_performance",
+        description="Run performance diagnostics and identify bottlenecks",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "duration": {
+                    "type": "integer",
+                    "description": "Duration to monitor in seconds",
+                    "default": 5
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_hardware_recommendations",
+        description="Get hardware upgrade recommendations based on system analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "use_case": {
+                    "type": "string",
+                    "enum": ["gaming", "productivity", "development", "content_creation", "general"],
+                    "description": "Primary use case for recommendations",
+                    "default": "general"
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_motherboard_details",
+        description="Get detailed motherboard information including manufacturer, model, BIOS, and hardware specifications",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_bios": {
+                    "type": "boolean",
+                    "description": "Include BIOS/UEFI information",
+                    "default": True
+                },
+                "include_slots": {
+                    "type": "boolean",
+                    "description": "Include expansion slot information",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_computer_model",
+        description="Get computer model and manufacturer information from the system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_details": {
+                    "type": "boolean",
+                    "description": "Include additional system details like SKU, UUID, and system family",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    )
+]
+
+
+def _cpu_busy_percent(before, after) -> float:
+    """Percent of CPU time spent busy between two psutil.cpu_times() readings
+    
+    Same arithmetic as psutil.cpu_percent: guest time is already counted in
+    user/nice, and iowait counts as idle.
+    """
+    total = busy = 0.0
+    for field, start, end in zip(after._fields, before, after):
+        if field in ("guest", "guest_nice"):
+            continue
+        delta = max(end - start, 0)
+        total += delta
+        if field not in ("idle", "iowait"):
+            busy += delta
+    return round(busy / total * 100, 1) if total > 0 else 0.0
+
+
+@lru_cache(maxsize=1024)
+def _local_isoformat(seconds: int) -> str:
+    """Local ISO 8601 time for a whole Unix second"""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+def _journal_time(realtime_us) -> str:
+    """Format a journal __REALTIME_TIMESTAMP (microseconds since the epoch)
+    
+    Consecutive journal entries mostly share a second, so only the
+    microsecond suffix is built per entry; the rest comes from the cache.
+    """
+    seconds, micros = divmod(int(realtime_us), 1000000)
+    prefix = _local_isoformat(seconds)
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+
+@lru_cache(maxsize=None)
+def _field_pattern(names: Tuple[str, ...]) -> "re.Pattern":
+    """Compile one pattern for the "Field: value" lines of the given field names"""
+    alternation = "|".join(map(re.escape, names))
+    return re.compile(rf"^[ \t]*({alternation}):[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
+def _text_fields(text: str, *tables: Dict[str, str]) -> Dict[str, str]:
+    """Map the command output lines of the fields named in tables by field name
+    
+    One regex scan matches only the wanted fields; later lines win.
+    """
+    names = tuple(sorted({name for table in tables for name in table}))
+    return dict(_field_pattern(names).findall(text))
+
+
+def _pick_fields(fields: Dict[str, str], keys: Dict[str, str]) -> Dict[str, str]:
+    """The fields named in keys, renamed to the keys they are reported under"""
+    return {key: fields[name] for name, key in keys.items() if name in fields}
+
+
+def _read_small_file(path: str, size: int = 4096) -> str:
+    """Read up to size bytes of a small (usually kernel-generated) file
+    
+    A single os.read on a raw descriptor skips the buffered text layer;
+    pseudo-files hand over their whole content in one read. Raises OSError.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size).decode("utf-8", "replace")
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1)
+def _linux_release() -> Dict[str, str]:
+    """Kernel version banner and distribution name, read once per process"""
+    release = {}
+    try:
+        release["kernel_version"] = _read_small_file('/proc/version').strip()
+    except OSError:
+        pass
+    
+    try:
+        text = _read_small_file('/etc/os-release')
+    except OSError:
+        text = ""
+    fields = dict(line.split('=', 1) for line in text.splitlines() if '=' in line)
+    if fields.get("PRETTY_NAME"):
+        release["distribution"] = fields["PRETTY_NAME"].strip().strip('"')
+    return release
+
+
+def _load_plist(data: bytes) -> Any:
+    """Parse a plist file's bytes, choosing the binary or XML parser by its header"""
+    import plistlib
+    fmt = plistlib.FMT_BINARY if data[:8] == b"bplist00" else plistlib.FMT_XML
+    return plistlib.loads(data, fmt=fmt)
+
+
+def _hardware_cached(kind: str):
+    """Cache an async hardware lookup per positional arguments for HARDWARE_TTL
+    
+    The cached dict is shared between calls; callers must copy it before
+    adding fields.
+    """
+    def wrap(method):
+        @wraps(method)
+        async def inner(self, *args):
+            return await self._cached_async((kind,) + args, HARDWARE_TTL, partial(method, self), *args)
+        return inner
+    return wrap
+
+
+class _ErrorResult(list):
+    """Content returned by a tool handler that failed; _timed counts it as an error"""
+
+
+def _error_result(text: str) -> List[types.TextContent]:
+    """Wrap a handler's error message so the failure is visible to _timed"""
+    return _ErrorResult([types.TextContent(type="text", text=text)])
+
+
+def _timed(name: str):
+    """Record call counts, error counts and total duration of a tool handler
+    
+    Totals go to the server's _metrics Counter as <name>.ok, <name>.err and
+    <name>.us (microseconds). Handlers report failures as text rather than
+    raising, returning them through _error_result so they count as errors too.
+    """
+    def wrap(fn):
+        @wraps(fn)
+        async def inner(self, arguments):
+            start = time.perf_counter()
+            try:
+                result = await fn(self, arguments)
+            except Exception:
+                self._metrics[name + ".err"] += 1
+                raise
+            finally:
+                self._metrics[name + ".us"] += int((time.perf_counter() - start) * 1e6)
+            if isinstance(result, _ErrorResult):
+                self._metrics[name + ".err"] += 1
+            else:
+                self._metrics[name + ".ok"] += 1
+            return result
+        return inner
+    return wrap
+
 
 @dataclass
 class SystemInfo:
@@ -55,636 +804,1180 @@ class SystemInfo:
     boot_time: float
 
 
+@dataclass
+class IOSample:
+    """Cumulative disk and network byte counters at one point in time"""
+    __slots__ = ("read_bytes", "write_bytes", "bytes_recv", "bytes_sent", "per_disk")
+    read_bytes: int
+    write_bytes: int
+    bytes_recv: int
+    bytes_sent: int
+    per_disk: Dict[str, int]
+    
+    @classmethod
+    def capture(cls) -> "IOSample":
+        """Read the current counters (zeros where the system reports none)"""
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        per_disk = psutil.disk_io_counters(perdisk=True) or {}
+        return cls(
+            read_bytes=disk.read_bytes if disk else 0,
+            write_bytes=disk.write_bytes if disk else 0,
+            bytes_recv=net.bytes_recv if net else 0,
+            bytes_sent=net.bytes_sent if net else 0,
+            per_disk={name: c.read_bytes + c.write_bytes for name, c in per_disk.items()}
+        )
+    
+    def rates(self, before: "IOSample", seconds: float) -> Dict[str, float]:
+        """MB/s for each counter between before and this sample"""
+        scale = seconds * (1024**2)
+        return {
+            "read": (self.read_bytes - before.read_bytes) / scale,
+            "write": (self.write_bytes - before.write_bytes) / scale,
+            "recv": (self.bytes_recv - before.bytes_recv) / scale,
+            "sent": (self.bytes_sent - before.bytes_sent) / scale
+        }
+    
+    def busiest_disk(self, before: "IOSample", seconds: float) -> Optional[Tuple[str, float]]:
+        """The disk with the most read+write traffic since before, with its MB/s
+        
+        Returns None when no disk saw any traffic.
+        """
+        deltas = (
+            (name, total - before.per_disk[name])
+            for name, total in self.per_disk.items() if name in before.per_disk
+        )
+        busiest = max(deltas, key=lambda item: item[1], default=None)
+        if busiest is None or busiest[1] <= 0:
+            return None
+        return busiest[0], busiest[1] / seconds / (1024**2)
+
+
 class SystemDiagnosticsServer:
     """Main MCP server for system diagnostics"""
     
     def __init__(self):
         self.server = Server("system-diagnostics")
         self.os_type = platform.system()
+        # Non-blocking CPU usage is the delta since the previous cpu_times()
+        # reading per percpu flag, kept here rather than in psutil, whose
+        # baseline is per thread; take a first reading now so interval=0 is
+        # meaningful later
+        self._cpu_times: Dict[bool, Any] = {
+            False: psutil.cpu_times(),
+            True: psutil.cpu_times(percpu=True)
+        }
+        # When that reading was taken per percpu flag, i.e. where the next
+        # non-blocking reading's window starts
+        now = time.monotonic()
+        self._cpu_sampled_at: Dict[bool, float] = {False: now, True: now}
+        # Last CPU usage sample per percpu flag, as (monotonic time, value)
+        self._cpu_samples: Dict[bool, Tuple[float, Any]] = {}
+        # Host identity, core counts, RAM size and boot time don't change while
+        # the server runs, so they are gathered once
+        self._static_info = self._collect_static_info()
+        # Per-process CPU/memory readings from the last diagnose_performance
+        # run, as (monotonic time, readings)
+        self._proc_snapshot: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        # Parsed dpkg database as (status file mtime_ns, applications)
+        self._dpkg_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        # Per-handler call/error counts and durations, filled in by @_timed
+        self._metrics: Counter = Counter()
+        # Slow-changing lookups, keyed by name (and arguments): (monotonic time, value)
+        self._cache: Dict[Any, Tuple[float, Any]] = {}
+        # Async lookups being computed, by cache key, so concurrent misses share one
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        # Process handles by pid, reused so per-process cpu_percent has a
+        # baseline from the previous call; guarded since collectors run in threads
+        self._proc_cache: Dict[int, psutil.Process] = {}
+        self._proc_lock = threading.Lock()
+        # Linux /proc snapshots: CPU ticks by (pid, start time) from the last
+        # process listing, and when it was taken
+        self._proc_ticks: Dict[Tuple[int, int], int] = {}
+        self._proc_ticks_time = time.monotonic()
+        # Per-thread COM state on Windows: whether COM is initialized and the
+        # thread's WMI connection (COM objects can't cross apartments)
+        self._com_local = threading.local()
         self.setup_handlers()
         
     def setup_handlers(self):
         """Set up the MCP server handlers"""
         
+        # Tool name -> handler coroutine
+        self._dispatch = {
+            "get_system_info": self.get_system_info,
+            "get_cpu_metrics": self.get_cpu_metrics,
+            "get_memory_metrics": self.get_memory_metrics,
+            "get_storage_metrics": self.get_storage_metrics,
+            "get_network_metrics": self.get_network_metrics,
+            "get_processes": self.get_processes,
+            "get_installed_applications": self.get_installed_applications,
+            "get_battery_status": self.get_battery_status,
+            "get_system_logs": self.get_system_logs,
+            "diagnose_performance": self.diagnose_performance,
+            "get_hardware_recommendations": self.get_hardware_recommendations,
+            "get_motherboard_details": self.get_motherboard_details,
+            "get_computer_model": self.get_computer_model,
+            # Not listed in TOOLS; for inspecting handler timings
+            "_get_internal_metrics": self.get_internal_metrics,
+        }
+        
         @self.server.list_tools()
         async def handle_list_tools() -> list[types.Tool]:
             """List available tools"""
-            return [
-                types.Tool(
-                    name="get_system_info",
-                    description="Get comprehensive system information including OS, hardware, and boot time",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_cpu_metrics",
-                    description="Get detailed CPU metrics including usage, frequency, temperature (if available)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "per_core": {
-                                "type": "boolean",
-                                "description": "Return per-core statistics",
-                                "default": False
-                            },
-                            "interval": {
-                                "type": "number",
-                                "description": "Sampling interval in seconds",
-                                "default": 1
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_memory_metrics",
-                    description="Get detailed memory usage including RAM, swap, and per-process memory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "include_processes": {
-                                "type": "boolean",
-                                "description": "Include top memory-consuming processes",
-                                "default": False
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_storage_metrics",
-                    description="Get storage information for all drives including SSDs, HDDs, and usage",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "include_io_stats": {
-                                "type": "boolean",
-                                "description": "Include I/O statistics",
-                                "default": False
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_network_metrics",
-                    description="Get network interface information and statistics",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "include_connections": {
-                                "type": "boolean",
-                                "description": "Include active network connections",
-                                "default": False
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_processes",
-                    description="Get information about running processes",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sort_by": {
-                                "type": "string",
-                                "enum": ["cpu", "memory", "name", "pid"],
-                                "description": "Sort processes by this metric",
-                                "default": "cpu"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of processes to return",
-                                "default": 20
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_installed_applications",
-                    description="Get list of installed applications on the system",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "category": {
-                                "type": "string",
-                                "description": "Filter by application category",
-                                "default": "all"
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_battery_status",
-                    description="Get battery status and power consumption information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_system_logs",
-                    description="Get recent system logs and events",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "log_type": {
-                                "type": "string",
-                                "enum": ["system", "application", "security", "all"],
-                                "description": "Type of logs to retrieve",
-                                "default": "system"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of log entries",
-                                "default": 100
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="diagnose_performance",
-                    description="Run performance diagnostics and identify bottlenecks",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "duration": {
-                                "type": "integer",
-                                "description": "Duration to monitor in seconds",
-                                "default": 5
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_hardware_recommendations",
-                    description="Get hardware upgrade recommendations based on system analysis",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "use_case": {
-                                "type": "string",
-                                "enum": ["gaming", "productivity", "development", "content_creation", "general"],
-                                "description": "Primary use case for recommendations",
-                                "default": "general"
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_motherboard_details",
-                    description="Get detailed motherboard information including manufacturer, model, BIOS, and hardware specifications",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "include_bios": {
-                                "type": "boolean",
-                                "description": "Include BIOS/UEFI information",
-                                "default": True
-                            },
-                            "include_slots": {
-                                "type": "boolean",
-                                "description": "Include expansion slot information",
-                                "default": True
-                            }
-                        },
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_computer_model",
-                    description="Get computer model and manufacturer information from the system",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "include_details": {
-                                "type": "boolean",
-                                "description": "Include additional system details like SKU, UUID, and system family",
-                                "default": True
-                            }
-                        },
-                        "required": []
-                    }
-                )
-            ]
+            return TOOLS
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
             """Handle tool calls"""
-            if name == "get_system_info":
-                return await self.get_system_info(arguments)
-            elif name == "get_cpu_metrics":
-                return await self.get_cpu_metrics(arguments)
-            elif name == "get_memory_metrics":
-                return await self.get_memory_metrics(arguments)
-            elif name == "get_storage_metrics":
-                return await self.get_storage_metrics(arguments)
-            elif name == "get_network_metrics":
-                return await self.get_network_metrics(arguments)
-            elif name == "get_processes":
-                return await self.get_processes(arguments)
-            elif name == "get_installed_applications":
-                return await self.get_installed_applications(arguments)
-            elif name == "get_battery_status":
-                return await self.get_battery_status(arguments)
-            elif name == "get_system_logs":
-                return await self.get_system_logs(arguments)
-            elif name == "diagnose_performance":
-                return await self.diagnose_performance(arguments)
-            elif name == "get_hardware_recommendations":
-                return await self.get_hardware_recommendations(arguments)
-            elif name == "get_motherboard_details":
-                return await self.get_motherboard_details(arguments)
-            elif name == "get_computer_model":
-                return await self.get_computer_model(arguments)
-            else:
+            handler = self._dispatch.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+            return await handler(arguments)
+    
+    def _initialization_options(self) -> InitializationOptions:
+        """Build the options announced to clients during initialization"""
+        return InitializationOptions(
+            server_name="system-diagnostics",
+            server_version="1.0.0",
+            capabilities=self.server.get_capabilities(
+                notification_options=NotificationOptions(),
+                experimental_capabilities={}
+            )
+        )
     
     async def run(self):
-        """Run the MCP server"""
+        """Run the MCP server over stdio, or SSE when MCP_TRANSPORT=sse"""
+        if os.environ.get("MCP_TRANSPORT", "stdio").lower() == "sse":
+            await self.run_sse(
+                host=os.environ.get("MCP_HOST", "127.0.0.1"),
+                port=int(os.environ.get("MCP_PORT", "8000"))
+            )
+            return
+        
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
                 write_stream,
-                InitializationOptions(
-                    server_name="system-diagnostics",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={}
-                    )
-                )
+                self._initialization_options()
+            )
+    
+    async def run_sse(self, host: str = "127.0.0.1", port: int = 8000):
+        """Serve MCP over HTTP + Server-Sent Events
+        
+        Each client gets its own session, so tool calls from different
+        clients run concurrently instead of queueing behind a single stdio pipe.
+        """
+        try:
+            import uvicorn
+            from mcp.server.sse import SseServerTransport
+            from starlette.applications import Starlette
+            from starlette.responses import Response
+            from starlette.routing import Mount, Route
+        except ImportError as e:
+            # The HTTP stack is only needed for SSE, so it's an optional extra
+            sys.exit(f"MCP_TRANSPORT=sse needs {e.name or 'uvicorn'}; "
+                     f"install it with: pip install \"system-diagnostics-mcp[sse]\"")
+        
+        sse = SseServerTransport("/messages/")
+        
+        async def handle_sse(request):
+            async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+                await self.server.run(read_stream, write_stream, self._initialization_options())
+            return Response()
+        
+        app = Starlette(routes=[
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+        ])
+        logger.info(f"Serving MCP over SSE at http://{host}:{port}/sse")
+        await uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning")).serve()
+    
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call in the default executor so the event loop stays free"""
+        loop = asyncio.get_running_loop()
+        if self.os_type == "Windows":
+            func = partial(self._in_com_apartment, func)
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+    
+    def _in_com_apartment(self, func, *args, **kwargs):
+        """Call func with COM initialized on the current worker thread (needed for WMI)"""
+        self._ensure_com()
+        return func(*args, **kwargs)
+    
+    def _ensure_com(self):
+        """Initialize COM once per thread
+        
+        Executor threads live as long as the process, so COM stays initialized
+        and the thread's WMI connection from _wmi() remains usable.
+        """
+        if not getattr(self._com_local, "initialized", False):
+            try:
+                import pythoncom
+            except ImportError:
+                # No pywin32, so no WMI; _wmi() raises and callers fall back
+                pythoncom = None
+            if pythoncom is not None:
+                pythoncom.CoInitialize()
+            self._com_local.initialized = True
+    
+    def _wmi(self):
+        """Return this thread's WMI connection, connecting on first use"""
+        conn = getattr(self._com_local, "wmi", None)
+        if conn is None:
+            import wmi
+            self._ensure_com()
+            conn = wmi.WMI()
+            self._com_local.wmi = conn
+        return conn
+    
+    def _wmi_query(self, wmi_class: str) -> List[Dict[str, Any]]:
+        """Return the instances of a WMI class as dicts of WMI_PROPERTIES
+        
+        Hardware classes don't change between calls, so the instances are
+        read once and shared; as plain dicts they can be used from any
+        thread, unlike the COM objects. Properties WMI reports as null are
+        left out.
+        """
+        return self._cached(("wmi", wmi_class), HARDWARE_TTL, self._read_wmi_class, wmi_class)
+    
+    def _wmi_queries(self, *wmi_classes: str) -> List[List[Dict[str, Any]]]:
+        """Return _wmi_query() for several classes, enumerating them concurrently
+        
+        Each worker opens its own COM apartment and WMI connection, so the
+        DCOM round trips of the classes overlap instead of adding up.
+        """
+        if importlib.util.find_spec("wmi") is None:
+            # The PowerShell fallback reads every class in one call anyway
+            return [self._wmi_query(wmi_class) for wmi_class in wmi_classes]
+        
+        with ThreadPoolExecutor(max_workers=len(wmi_classes)) as pool:
+            futures = [
+                pool.submit(self._in_com_apartment, self._wmi_query, wmi_class)
+                for wmi_class in wmi_classes
+            ]
+        return [future.result() for future in futures]
+    
+    def _read_wmi_class(self, wmi_class: str) -> List[Dict[str, Any]]:
+        """Enumerate a WMI class, reading only the properties in WMI_PROPERTIES"""
+        try:
+            conn = self._wmi()
+        except ImportError:
+            # No pywin32; read every class through one PowerShell call instead
+            return self._cached(("cim",), HARDWARE_TTL, self._read_cim_classes)[wmi_class]
+        
+        properties = WMI_PROPERTIES[wmi_class]
+        # Selecting the properties by name keeps WMI from marshalling every
+        # property of every instance; wmi's query() also asks for a
+        # forward-only, return-immediately enumerator
+        wql = f"SELECT {', '.join(properties)} FROM {wmi_class}"
+        rows = []
+        for instance in conn.query(wql):
+            row = {}
+            for name in properties:
+                value = getattr(instance, name, None)
+                if value is not None:
+                    row[name] = value
+            rows.append(row)
+        return rows
+    
+    @staticmethod
+    def _read_cim_classes() -> Dict[str, List[Dict[str, Any]]]:
+        """Read all WMI_PROPERTIES classes with Get-CimInstance in one process
+        
+        Raises RuntimeError when PowerShell is missing or fails, so callers
+        fall back to wmic.
+        """
+        try:
+            result = subprocess.run(
+                ["powershell", "-NoProfile", "-NonInteractive", "-Command", CIM_SCRIPT],
+                capture_output=True,
+                text=True,
+                timeout=30
             )
+        except (OSError, subprocess.SubprocessError) as e:
+            raise RuntimeError(f"PowerShell unavailable: {e}")
+        if result.returncode != 0:
+            raise RuntimeError(f"Get-CimInstance failed: {result.stderr.strip()}")
+        
+        data = loads(result.stdout)
+        return {
+            wmi_class: [
+                {name: value for name, value in row.items() if value is not None}
+                for row in data.get(wmi_class) or []
+            ]
+            for wmi_class in WMI_PROPERTIES
+        }
     
+    def _cached(self, key: Any, ttl: Optional[float], fn, *args) -> Any:
+        """Return fn(*args), reusing the stored result for ttl seconds"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and (ttl is None or now - hit[0] < ttl):
+            return hit[1]
+        value = fn(*args)
+        self._cache[key] = (now, value)
+        return value
+    
+    async def _cached_async(self, key: Any, ttl: Optional[float], fn, *args) -> Any:
+        """Return await fn(*args), reusing the stored result for ttl seconds
+        
+        Calls that miss while the value is being computed wait for that
+        computation instead of starting their own, so a burst of requests
+        runs fn once.
+        """
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and (ttl is None or now - hit[0] < ttl):
+            return hit[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill_cache(key, fn, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller mustn't cancel the computation others wait on
+        return await asyncio.shield(task)
+    
+    async def _fill_cache(self, key: Any, fn, *args) -> Any:
+        """Await fn(*args) and store the result under key"""
+        now = time.monotonic()
+        value = await fn(*args)
+        self._cache[key] = (now, value)
+        return value
+    
+    def _live_procs(self) -> Tuple[List[psutil.Process], int]:
+        """Return handles for all running processes and how many are new
+        
+        Iterates psutil.pids() rather than process_iter(), which re-checks
+        every cached handle with create_time() on each pass. New handles get
+        their cpu_percent baseline primed; handles of exited pids are dropped.
+        Linux reads /proc directly instead (see _linux_process_snapshot).
+        """
+        with self._proc_lock:
+            pids = psutil.pids()
+            live = set(pids)
+            for pid in [pid for pid in self._proc_cache if pid not in live]:
+                del self._proc_cache[pid]
+            
+            procs = []
+            new = 0
+            for pid in pids:
+                proc = self._proc_cache.get(pid)
+                if proc is None:
+                    try:
+                        proc = psutil.Process(pid)
+                        proc.cpu_percent(None)
+                    except psutil.NoSuchProcess:
+                        continue
+                    except psutil.AccessDenied:
+                        pass
+                    self._proc_cache[pid] = proc
+                    new += 1
+                procs.append(proc)
+            return procs, new
+    
+    @staticmethod
+    def _linux_full_name(proc_dir: str, comm: str) -> str:
+        """Complete a comm name cut off at LINUX_COMM_LEN from argv[0], as psutil does"""
+        try:
+            with open(f"{proc_dir}/cmdline", "rb") as f:
+                argv0 = f.read().partition(b"\0")[0]
+        except OSError:
+            return comm
+        full_name = os.path.basename(argv0.decode("utf-8", "replace"))
+        return full_name if full_name.startswith(comm) else comm
+    
+    @classmethod
+    def _linux_process_snapshot(cls, proc_root: str = "/proc") -> List[Dict[str, Any]]:
+        """Read every process's /proc/<pid>/stat with plain file reads
+        
+        An order of magnitude cheaper than going through psutil.Process for
+        each pid. Kernel threads (kthreadd and its children) carry no
+        meaningful cpu/memory attribution and are left out.
+        """
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        snapshot = []
+        for entry in os.listdir(proc_root):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"{proc_root}/{entry}/stat", "rb") as f:
+                    data = f.read()
+            except OSError:  # Exited since listdir
+                continue
+            
+            # comm may itself contain spaces or parentheses, so split on the
+            # last ")"; the remaining fields start at field 3 (state)
+            head, _, tail = data.rpartition(b")")
+            fields = tail.split()
+            pid = int(entry)
+            ppid = int(fields[1])
+            if pid == 2 or ppid == 2:
+                continue
+            name = head.partition(b"(")[2].decode("utf-8", "replace")
+            if len(name) >= LINUX_COMM_LEN:
+                name = cls._linux_full_name(f"{proc_root}/{entry}", name)
+            snapshot.append({
+                "pid": pid,
+                "name": name,
+                "state": fields[0].decode(),
+                "ticks": int(fields[11]) + int(fields[12]),  # utime + stime
+                "threads": int(fields[17]),
+                "start": int(fields[19]),
+                "rss": int(fields[21]) * page_size
+            })
+        return snapshot
+    
+    def _collect_linux_processes(self, sort_by: str) -> List[Dict[str, Any]]:
+        """Build process entries from /proc, with CPU usage since the previous call"""
+        with self._proc_lock:
+            baseline, baseline_time = self._proc_ticks, self._proc_ticks_time
+            snapshot = self._linux_process_snapshot()
+            now = time.monotonic()
+            if sort_by == "cpu" and any((p["pid"], p["start"]) not in baseline for p in snapshot):
+                # Processes seen for the first time have no earlier reading;
+                # give them a short window so their usage isn't a meaningless 0.0
+                baseline = {(p["pid"], p["start"]): p["ticks"] for p in snapshot}
+                baseline_time = now
+                time.sleep(PROC_CPU_WARMUP)
+                snapshot = self._linux_process_snapshot()
+                now = time.monotonic()
+            self._proc_ticks = {(p["pid"], p["start"]): p["ticks"] for p in snapshot}
+            self._proc_ticks_time = now
+        
+        clk_tck = os.sysconf("SC_CLK_TCK")
+        elapsed = (now - baseline_time) * clk_tck
+        total_ram = psutil.virtual_memory().total
+        boot_time = self._static_info.boot_time
+        
+        processes = []
+        for p in snapshot:
+            prev_ticks = baseline.get((p["pid"], p["start"]))
+            cpu_percent = (p["ticks"] - prev_ticks) / elapsed * 100 if prev_ticks is not None and elapsed > 0 else 0.0
+            processes.append({
+                "pid": p["pid"],
+                "name": p["name"],
+                "cpu_percent": round(cpu_percent, 2),
+                "memory_percent": round(p["rss"] / total_ram * 100, 2),
+                "status": LINUX_PROC_STATES.get(p["state"], p["state"]),
+                "threads": p["threads"],
+                "created": datetime.fromtimestamp(boot_time + p["start"] / clk_tck).strftime('%Y-%m-%d %H:%M:%S')
+            })
+        return processes
+    
+    def _forget_proc(self, pid: int) -> None:
+        """Drop a cached handle whose process has exited"""
+        with self._proc_lock:
+            self._proc_cache.pop(pid, None)
+    
+    def _collect_static_info(self) -> SystemInfo:
+        """Gather the system information that stays fixed for the process lifetime"""
+        uname = platform.uname()
+        return SystemInfo(
+            os_type=uname.system,
+            os_version=uname.version,
+            hostname=uname.node,
+            architecture=uname.machine,
+            processor=uname.processor,
+            physical_cores=psutil.cpu_count(logical=False) or 0,
+            logical_cores=psutil.cpu_count(logical=True) or 0,
+            total_ram_gb=round(psutil.virtual_memory().total / (1024**3), 2),
+            boot_time=psutil.boot_time()
+        )
+    
+    def _platform_summary(self) -> Dict[str, Any]:
+        """Platform, architecture, machine and hostname for the hardware reports"""
+        # platform.architecture() may run `file` on the interpreter binary,
+        # so compute this once per process
+        summary = self._cached("platform_summary", None, lambda: {
+            "platform": self.os_type,
+            "architecture": platform.architecture()[0],
+            "machine": self._static_info.architecture,
+            "hostname": self._static_info.hostname
+        })
+        return dict(summary)
+    
+    async def get_internal_metrics(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """Get call counts, error counts and total durations per tool handler"""
+        return [types.TextContent(
+            type="text",
+            text=dumps(dict(sorted(self._metrics.items())))
+        )]
+    
+    @_timed("get_system_info")
     async def get_system_info(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get comprehensive system information"""
         try:
-            info = SystemInfo(
-                os_type=platform.system(),
-                os_version=platform.version(),
-                hostname=platform.node(),
-                architecture=platform.machine(),
-                processor=platform.processor(),
-                physical_cores=psutil.cpu_count(logical=False) or 0,
-                logical_cores=psutil.cpu_count(logical=True) or 0,
-                total_ram_gb=round(psutil.virtual_memory().total / (1024**3), 2),
-                boot_time=psutil.boot_time()
-            )
-            
-            boot_time_str = datetime.fromtimestamp(info.boot_time).strftime('%Y-%m-%d %H:%M:%S')
-            uptime_seconds = time.time() - info.boot_time
-            uptime_days = int(uptime_seconds // 86400)
-            uptime_hours = int((uptime_seconds % 86400) // 3600)
-            
-            result = {
-                "system_info": asdict(info),
-                "boot_time_formatted": boot_time_str,
-                "uptime": f"{uptime_days} days, {uptime_hours} hours"
-            }
+            result = await self._collect_system_info(arguments)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(result, indent=2)
+                text=dumps(result)
             )]
         except Exception as e:
             logger.error(f"Error getting system info: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
+    
+    async def _collect_system_info(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the system information report"""
+        info = self._static_info
+        
+        boot_time_str = datetime.fromtimestamp(info.boot_time).strftime('%Y-%m-%d %H:%M:%S')
+        uptime_seconds = time.time() - info.boot_time
+        uptime_days = int(uptime_seconds // 86400)
+        uptime_hours = int((uptime_seconds % 86400) // 3600)
+        
+        return {
+            "system_info": asdict(info),
+            "boot_time_formatted": boot_time_str,
+            "uptime": f"{uptime_days} days, {uptime_hours} hours"
+        }
     
+    @_timed("get_cpu_metrics")
     async def get_cpu_metrics(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get detailed CPU metrics"""
         try:
-            per_core = arguments.get("per_core", False)
-            interval = arguments.get("interval", 1)
-            
-            metrics = {
-                "usage_percent": psutil.cpu_percent(interval=interval, percpu=per_core),
-                "frequency": {}
-            }
-            
-            # CPU frequency
-            freq = psutil.cpu_freq(percpu=per_core)
-            if freq:
-                if per_core:
-                    metrics["frequency"] = [
-                        {"current": f.current, "min": f.min, "max": f.max} 
-                        for f in freq
-                    ]
-                else:
-                    metrics["frequency"] = {
-                        "current": freq.current,
-                        "min": freq.min,
-                        "max": freq.max
-                    }
-            
-            # CPU stats
-            stats = psutil.cpu_stats()
-            metrics["stats"] = {
-                "ctx_switches": stats.ctx_switches,
-                "interrupts": stats.interrupts,
-                "soft_interrupts": stats.soft_interrupts,
-                "syscalls": stats.syscalls
-            }
-            
-            # CPU times
-            times = psutil.cpu_times()
-            metrics["times"] = {
-                "user": times.user,
-                "system": times.system,
-                "idle": times.idle
-            }
-            
-            # Temperature (if available)
-            if hasattr(psutil, "sensors_temperatures"):
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    metrics["temperatures"] = {}
-                    for name, entries in temps.items():
-                        metrics["temperatures"][name] = [
-                            {"label": e.label, "current": e.current, "high": e.high, "critical": e.critical}
-                            for e in entries
-                        ]
+            metrics = await self._collect_cpu(arguments)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(metrics, indent=2)
+                text=dumps(metrics)
             )]
         except Exception as e:
             logger.error(f"Error getting CPU metrics: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
+    
+    async def _collect_cpu(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the CPU metrics report"""
+        per_core = arguments.get("per_core", False)
+        interval = arguments.get("interval")
+        
+        # The readings are independent, so the cheap ones run while the
+        # usage sample waits out its interval
+        usage, freq, stats, times, temps = await asyncio.gather(
+            self._cpu_usage(interval, per_core),
+            self._run_blocking(psutil.cpu_freq, per_core),
+            self._run_blocking(psutil.cpu_stats),
+            self._run_blocking(psutil.cpu_times),
+            self._run_blocking(getattr(psutil, "sensors_temperatures", lambda: None))
+        )
+        
+        metrics = {
+            "usage_percent": usage,
+            "frequency": {}
+        }
+        
+        # CPU frequency
+        if freq:
+            if per_core:
+                metrics["frequency"] = [
+                    {"current": f.current, "min": f.min, "max": f.max} 
+                    for f in freq
+                ]
+            else:
+                metrics["frequency"] = {
+                    "current": freq.current,
+                    "min": freq.min,
+                    "max": freq.max
+                }
+        
+        # CPU stats
+        metrics["stats"] = {
+            "ctx_switches": stats.ctx_switches,
+            "interrupts": stats.interrupts,
+            "soft_interrupts": stats.soft_interrupts,
+            "syscalls": stats.syscalls
+        }
+        
+        # CPU times
+        metrics["times"] = {
+            "user": times.user,
+            "system": times.system,
+            "idle": times.idle
+        }
+        
+        # Temperature (if available)
+        if temps:
+            metrics["temperatures"] = {}
+            for name, entries in temps.items():
+                metrics["temperatures"][name] = [
+                    {"label": e.label, "current": e.current, "high": e.high, "critical": e.critical}
+                    for e in entries
+                ]
+        
+        return metrics
+    
+    async def _cpu_usage(self, interval: Optional[float], per_core: bool) -> Any:
+        """Measure CPU usage over interval seconds, or since the previous reading
+        
+        With no interval the usage covers the time since the stored reading,
+        waiting (without blocking the loop) until that window is at least
+        CPU_MIN_WINDOW long. interval=0 may reuse a reading from the last 200ms.
+        """
+        if interval is None:
+            remaining = CPU_MIN_WINDOW - (time.monotonic() - self._cpu_sampled_at[per_core])
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            now = time.monotonic()
+            usage = self._cpu_usage_since(per_core)
+        elif not interval:
+            return self._sample_cpu_percent(per_core)
+        else:
+            # Measure from a reading of our own so a concurrent call that
+            # moves the stored one can't shorten the window
+            before = psutil.cpu_times(percpu=per_core)
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            usage = self._cpu_usage_since(per_core, before)
+        self._cpu_sampled_at[per_core] = now
+        self._cpu_samples[per_core] = (now, usage)
+        return usage
+    
+    def _sample_cpu_percent(self, per_core: bool) -> Any:
+        """Get CPU usage without blocking, reusing a sample taken in the last 200ms
+        
+        Non-blocking usage is the delta since the previous reading (or the
+        one taken in __init__), so very recent samples are returned
+        from cache rather than computed over a near-empty window.
+        """
+        now = time.monotonic()
+        cached = self._cpu_samples.get(per_core)
+        if cached is not None and now - cached[0] <= CPU_SAMPLE_MAX_AGE:
+            return cached[1]
+        
+        usage = self._cpu_usage_since(per_core)
+        self._cpu_sampled_at[per_core] = now
+        self._cpu_samples[per_core] = (now, usage)
+        return usage
+    
+    def _cpu_usage_since(self, per_core: bool, before: Any = None) -> Any:
+        """CPU usage from before (default: the stored reading) until now
+        
+        The new reading replaces the stored one, so the next call measures
+        from here.
+        """
+        after = psutil.cpu_times(percpu=per_core)
+        if before is None:
+            before = self._cpu_times[per_core]
+        self._cpu_times[per_core] = after
+        if per_core:
+            return [_cpu_busy_percent(start, end) for start, end in zip(before, after)]
+        return _cpu_busy_percent(before, after)
     
+    @_timed("get_memory_metrics")
     async def get_memory_metrics(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get detailed memory metrics"""
         try:
-            include_processes = arguments.get("include_processes", False)
-            
-            # Virtual memory
-            vm = psutil.virtual_memory()
-            metrics = {
-                "virtual_memory": {
-                    "total_gb": round(vm.total / (1024**3), 2),
-                    "available_gb": round(vm.available / (1024**3), 2),
-                    "used_gb": round(vm.used / (1024**3), 2),
-                    "free_gb": round(vm.free / (1024**3), 2),
-                    "percent": vm.percent
-                }
-            }
-            
-            # Swap memory
-            swap = psutil.swap_memory()
-            metrics["swap_memory"] = {
-                "total_gb": round(swap.total / (1024**3), 2),
-                "used_gb": round(swap.used / (1024**3), 2),
-                "free_gb": round(swap.free / (1024**3), 2),
-                "percent": swap.percent
-            }
-            
-            # Top memory-consuming processes
-            if include_processes:
-                processes = []
-                for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'memory_info']):
-                    try:
-                        pinfo = proc.info
-                        processes.append({
-                            "pid": pinfo['pid'],
-                            "name": pinfo['name'],
-                            "memory_percent": round(pinfo['memory_percent'], 2),
-                            "memory_mb": round(pinfo['memory_info'].rss / (1024**2), 2)
-                        })
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-                
-                processes.sort(key=lambda x: x['memory_percent'], reverse=True)
-                metrics["top_processes"] = processes[:10]
+            result = await self._run_blocking(self._collect_memory, arguments)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(metrics, indent=2)
+                text=dumps(result)
             )]
         except Exception as e:
             logger.error(f"Error getting memory metrics: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
     
-    async def get_storage_metrics(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
-        """Get storage metrics for all drives"""
-        try:
-            include_io = arguments.get("include_io_stats", False)
-            
-            metrics = {"partitions": []}
+    def _collect_memory(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect memory metrics (blocking; run via _run_blocking)"""
+        include_processes = arguments.get("include_processes", False)
+        
+        # Virtual memory
+        vm = psutil.virtual_memory()
+        metrics = {
+            "virtual_memory": {
+                "total_gb": round(vm.total / (1024**3), 2),
+                "available_gb": round(vm.available / (1024**3), 2),
+                "used_gb": round(vm.used / (1024**3), 2),
+                "free_gb": round(vm.free / (1024**3), 2),
+                "percent": vm.percent
+            }
+        }
+        
+        # Swap memory
+        swap = psutil.swap_memory()
+        metrics["swap_memory"] = {
+            "total_gb": round(swap.total / (1024**3), 2),
+            "used_gb": round(swap.used / (1024**3), 2),
+            "free_gb": round(swap.free / (1024**3), 2),
+            "percent": swap.percent
+        }
+        
+        # Top memory-consuming processes
+        if include_processes:
+            # Derive memory_percent from the rss we already fetch instead of
+            # asking psutil for it separately (which re-reads memory_info)
+            if self.os_type == "Linux":
+                entries = [(p["pid"], p["name"], p["rss"]) for p in self._linux_process_snapshot()]
+            else:
+                entries = []
+                procs, _ = self._live_procs()
+                for proc in procs:
+                    try:
+                        with proc.oneshot():
+                            entries.append((proc.pid, proc.name(), proc.memory_info().rss))
+                    except psutil.NoSuchProcess:
+                        self._forget_proc(proc.pid)
+                    except psutil.AccessDenied:
+                        pass
             
-            # Disk partitions
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    partition_info = {
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "fstype": partition.fstype,
-                        "total_gb": round(usage.total / (1024**3), 2),
-                        "used_gb": round(usage.used / (1024**3), 2),
-                        "free_gb": round(usage.free / (1024**3), 2),
-                        "percent": usage.percent
-                    }
-                    
-                    # Try to determine if SSD or HDD (platform-specific)
-                    if self.os_type == "Windows":
-                        partition_info["type"] = self._get_windows_drive_type(partition.device)
-                    elif self.os_type == "Darwin":
-                        partition_info["type"] = self._get_macos_drive_type(partition.device)
-                    else:
-                        partition_info["type"] = "Unknown"
-                    
-                    metrics["partitions"].append(partition_info)
-                except PermissionError:
+            processes = []
+            for pid, name, rss in entries:
+                memory_percent = rss / vm.total * 100
+                # Only the top 10 are kept; negligible users never make it
+                if memory_percent < 0.01:
                     continue
+                processes.append({
+                    "pid": pid,
+                    "name": name,
+                    "memory_percent": round(memory_percent, 2),
+                    "memory_mb": round(rss / (1024**2), 2)
+                })
             
-            # I/O statistics
-            if include_io:
-                io_counters = psutil.disk_io_counters(perdisk=True)
-                metrics["io_stats"] = {}
-                for disk, counters in io_counters.items():
-                    metrics["io_stats"][disk] = {
-                        "read_count": counters.read_count,
-                        "write_count": counters.write_count,
-                        "read_mb": round(counters.read_bytes / (1024**2), 2),
-                        "write_mb": round(counters.write_bytes / (1024**2), 2),
-                        "read_time_ms": counters.read_time,
-                        "write_time_ms": counters.write_time
-                    }
+            metrics["top_processes"] = heapq.nlargest(10, processes, key=lambda x: x['memory_percent'])
+        
+        return metrics
+    
+    @_timed("get_storage_metrics")
+    async def get_storage_metrics(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """Get storage metrics for all drives"""
+        try:
+            result = await self._run_blocking(self._collect_storage, arguments)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(metrics, indent=2)
+                text=dumps(result)
             )]
         except Exception as e:
             logger.error(f"Error getting storage metrics: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
+    
+    def _collect_storage(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect storage metrics (blocking; run via _run_blocking)"""
+        include_io = arguments.get("include_io_stats", False)
+        
+        metrics = {"partitions": []}
+        
+        # Disk partitions
+        for partition in self._cached("partitions", PARTITIONS_TTL, psutil.disk_partitions):
+            try:
+                total, used, free, percent = self._disk_usage(partition.mountpoint)
+                partition_info = {
+                    "device": partition.device,
+                    "mountpoint": partition.mountpoint,
+                    "fstype": partition.fstype,
+                    "total_gb": round(total / (1024**3), 2),
+                    "used_gb": round(used / (1024**3), 2),
+                    "free_gb": round(free / (1024**3), 2),
+                    "percent": percent
+                }
+                
+                # Try to determine if SSD or HDD (platform-specific)
+                partition_info["type"] = self._drive_type(partition.device)
+                
+                metrics["partitions"].append(partition_info)
+            except OSError:
+                # Unreadable, stale (NFS) or vanished mounts are skipped
+                continue
+        
+        # I/O statistics
+        if include_io:
+            io_counters = psutil.disk_io_counters(perdisk=True)
+            metrics["io_stats"] = {}
+            for disk, counters in io_counters.items():
+                metrics["io_stats"][disk] = {
+                    "read_count": counters.read_count,
+                    "write_count": counters.write_count,
+                    "read_mb": round(counters.read_bytes / (1024**2), 2),
+                    "write_mb": round(counters.write_bytes / (1024**2), 2),
+                    "read_time_ms": counters.read_time,
+                    "write_time_ms": counters.write_time
+                }
+        
+        return metrics
+    
+    @staticmethod
+    def _disk_usage(mountpoint: str) -> Tuple[int, int, int, float]:
+        """Return (total, used, free, percent) for a mountpoint
+        
+        Calls statvfs directly where available, using the same arithmetic as
+        psutil.disk_usage: free is what unprivileged users can allocate and
+        percent is relative to the space those users can see.
+        """
+        if not hasattr(os, "statvfs"):  # Windows
+            usage = psutil.disk_usage(mountpoint)
+            return usage.total, usage.used, usage.free, usage.percent
+        
+        st = os.statvfs(mountpoint)
+        total = st.f_blocks * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        used = total - st.f_bfree * st.f_frsize
+        user_total = used + free
+        percent = round(used / user_total * 100, 1) if user_total else 0.0
+        return total, used, free, percent
+    
+    @staticmethod
+    def _get_windows_seek_penalty(device: str) -> Optional[bool]:
+        """Ask the storage driver whether the volume incurs a seek penalty
+        
+        Sends IOCTL_STORAGE_QUERY_PROPERTY for StorageDeviceSeekPenaltyProperty
+        on the volume handle, which needs no admin rights and no COM/WMI session.
+        Returns None when the driver doesn't answer.
+        """
+        import ctypes
+        from ctypes import wintypes
+        
+        IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+        StorageDeviceSeekPenaltyProperty = 7
+        PropertyStandardQuery = 0
+        FILE_SHARE_READ_WRITE = 0x1 | 0x2
+        OPEN_EXISTING = 3
+        INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+        
+        class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+            _fields_ = [("PropertyId", wintypes.DWORD),
+                        ("QueryType", wintypes.DWORD),
+                        ("AdditionalParameters", wintypes.BYTE * 1)]
+        
+        class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+            _fields_ = [("Version", wintypes.DWORD),
+                        ("Size", wintypes.DWORD),
+                        ("IncursSeekPenalty", wintypes.BOOLEAN)]
+        
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        
+        # C:\ -> \\.\C:
+        path = "\\\\.\\" + device.rstrip("\\")
+        handle = kernel32.CreateFileW(path, 0, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None)
+        if handle == INVALID_HANDLE_VALUE:
+            return None
+        try:
+            query = STORAGE_PROPERTY_QUERY(StorageDeviceSeekPenaltyProperty, PropertyStandardQuery)
+            result = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+            returned = wintypes.DWORD()
+            ok = kernel32.DeviceIoControl(
+                wintypes.HANDLE(handle), IOCTL_STORAGE_QUERY_PROPERTY,
+                ctypes.byref(query), ctypes.sizeof(query),
+                ctypes.byref(result), ctypes.sizeof(result),
+                ctypes.byref(returned), None
+            )
+            if not ok:
+                return None
+            return bool(result.IncursSeekPenalty)
+        finally:
+            kernel32.CloseHandle(wintypes.HANDLE(handle))
+    
+    def _drive_type(self, device: str) -> str:
+        """Return the cached SSD/HDD classification for a partition device"""
+        if self.os_type == "Windows":
+            collect = self._get_windows_drive_type
+        elif self.os_type == "Darwin":
+            collect = self._get_macos_drive_type
+        else:
+            return "Unknown"
+        return self._cached(("drive_type", device), DRIVE_TYPE_TTL, collect, device)
+    
+    def _ssd_map(self) -> Dict[str, bool]:
+        """Map each partition device to whether it sits on an SSD"""
+        ssd_map = {}
+        for partition in self._cached("partitions", PARTITIONS_TTL, psutil.disk_partitions):
+            ssd_map[partition.device] = self._drive_type(partition.device) == "SSD"
+        return ssd_map
     
     def _get_windows_drive_type(self, device: str) -> str:
         """Determine if Windows drive is SSD or HDD"""
         try:
-            if platform.system() == "Windows":
-                c = wmi.WMI()
+            if self.os_type == "Windows":
+                seek_penalty = self._get_windows_seek_penalty(device)
+                if seek_penalty is not None:
+                    return "HDD" if seek_penalty else "SSD"
+                
+                # Fall back to WMI when the driver doesn't report seek penalty
                 device_id = device.replace("\\", "").replace(":", "")
-                for disk in c.Win32_DiskDrive():
-                    if device_id in disk.DeviceID:
-                        if disk.MediaType and "SSD" in disk.MediaType:
+                for disk in self._wmi_query("Win32_DiskDrive"):
+                    if device_id in disk.get("DeviceID", ""):
+                        media_type = disk.get("MediaType")
+                        if media_type and "SSD" in media_type:
                             return "SSD"
-                        elif disk.MediaType:
+                        elif media_type:
                             return "HDD"
             return "Unknown"
-        except:
+        except Exception:
+            # ImportError without pywin32, or a COM error from WMI
             return "Unknown"
     
     def _get_macos_drive_type(self, device: str) -> str:
         """Determine if macOS drive is SSD or HDD"""
         try:
+            # The plist form carries a SolidState boolean, so there's no need
+            # to scan the human-readable text output
             result = subprocess.run(
-                ["diskutil", "info", device],
-                capture_output=True,
-                text=True
+                ["diskutil", "info", "-plist", device],
+                capture_output=True
             )
-            if "Solid State" in result.stdout:
+            if result.returncode != 0:
+                return "Unknown"
+            solid_state = _load_plist(result.stdout).get("SolidState")
+            if solid_state is True:
                 return "SSD"
-            elif "Rotational" in result.stdout:
+            elif solid_state is False:
                 return "HDD"
             return "Unknown"
-        except:
+        except Exception:
+            # diskutil missing, or empty/malformed output (plistlib raises
+            # several types, including ExpatError for non-XML input)
             return "Unknown"
     
+    @_timed("get_network_metrics")
     async def get_network_metrics(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get network metrics"""
         try:
             include_connections = arguments.get("include_connections", False)
             
-            metrics = {"interfaces": {}}
-            
-            # Network interfaces
-            interfaces = psutil.net_if_addrs()
-            stats = psutil.net_if_stats()
-            io_counters = psutil.net_io_counters(pernic=True)
-            
-            for iface, addrs in interfaces.items():
-                interface_info = {
-                    "addresses": [],
-                    "is_up": stats[iface].isup if iface in stats else False,
-                    "speed_mbps": stats[iface].speed if iface in stats else 0
-                }
-                
-                for addr in addrs:
-                    addr_info = {
-                        "family": str(addr.family),
-                        "address": addr.address,
-                        "netmask": addr.netmask,
-                        "broadcast": addr.broadcast
-                    }
-                    interface_info["addresses"].append(addr_info)
-                
-                if iface in io_counters:
-                    counter = io_counters[iface]
-                    interface_info["statistics"] = {
-                        "bytes_sent_mb": round(counter.bytes_sent / (1024**2), 2),
-                        "bytes_recv_mb": round(counter.bytes_recv / (1024**2), 2),
-                        "packets_sent": counter.packets_sent,
-                        "packets_recv": counter.packets_recv,
-                        "errors_in": counter.errin,
-                        "errors_out": counter.errout
-                    }
-                
-                metrics["interfaces"][iface] = interface_info
-            
-            # Active connections
-            if include_connections:
-                connections = []
-                for conn in psutil.net_connections(kind='inet'):
-                    conn_info = {
-                        "family": str(conn.family),
-                        "type": str(conn.type),
-                        "local_address": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else None,
-                        "remote_address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
-                        "status": conn.status,
-                        "pid": conn.pid
-                    }
-                    connections.append(conn_info)
-                metrics["connections"] = connections[:50]  # Limit to 50 connections
+            interfaces, stats, io_counters, connections = await asyncio.gather(
+                self._run_blocking(psutil.net_if_addrs),
+                self._run_blocking(psutil.net_if_stats),
+                self._run_blocking(psutil.net_io_counters, pernic=True),
+                self._run_blocking(self._collect_connections, CONNECTION_LIMIT)
+                if include_connections else asyncio.sleep(0)
+            )
+            result = self._build_network_metrics(interfaces, stats, io_counters, connections)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(metrics, indent=2)
+                text=dumps(result)
             )]
         except Exception as e:
             logger.error(f"Error getting network metrics: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
     
+    def _build_network_metrics(self, interfaces, stats, io_counters, connections) -> Dict[str, Any]:
+        """Assemble network metrics from psutil interface and connection readings"""
+        metrics = {"interfaces": {}}
+        
+        # Network interfaces
+        for iface, addrs in interfaces.items():
+            interface_info = {
+                "addresses": [],
+                "is_up": stats[iface].isup if iface in stats else False,
+                "speed_mbps": stats[iface].speed if iface in stats else 0
+            }
+            
+            for addr in addrs:
+                addr_info = {
+                    "family": FAMILY_NAMES.get(addr.family) or str(addr.family),
+                    "address": addr.address,
+                    "netmask": addr.netmask,
+                    "broadcast": addr.broadcast
+                }
+                interface_info["addresses"].append(addr_info)
+            
+            if iface in io_counters:
+                counter = io_counters[iface]
+                interface_info["statistics"] = {
+                    "bytes_sent_mb": round(counter.bytes_sent / (1024**2), 2),
+                    "bytes_recv_mb": round(counter.bytes_recv / (1024**2), 2),
+                    "packets_sent": counter.packets_sent,
+                    "packets_recv": counter.packets_recv,
+                    "errors_in": counter.errin,
+                    "errors_out": counter.errout
+                }
+            
+            metrics["interfaces"][iface] = interface_info
+        
+        # Active connections
+        if connections is not None:
+            metrics["connections"] = connections
+        
+        return metrics
+    
+    def _collect_connections(self, limit: int) -> List[Dict[str, Any]]:
+        """Collect up to limit inet connections, stopping once enough are found"""
+        if self.os_type == "Linux":
+            return self._linux_inet_connections(limit)
+        
+        connections = []
+        for conn in psutil.net_connections(kind='inet'):
+            connections.append({
+                "family": FAMILY_NAMES.get(conn.family) or str(conn.family),
+                "type": SOCKET_TYPES.get(conn.type) or str(conn.type),
+                "local_address": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else None,
+                "remote_address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
+                "status": conn.status,
+                "pid": conn.pid
+            })
+            if len(connections) >= limit:
+                break
+        return connections
+    
+    @staticmethod
+    def _decode_proc_net_address(address: str, family: int) -> Optional[str]:
+        """Turn a /proc/net address like 0100007F:0277 into 127.0.0.1:631"""
+        ip_hex, _, port_hex = address.partition(":")
+        port = int(port_hex, 16)
+        if not port:
+            return None
+        raw = bytes.fromhex(ip_hex)
+        # The kernel prints each 32-bit word of the address in host order
+        if family == socket.AF_INET:
+            raw = raw[::-1]
+        else:
+            raw = struct.pack(">4I", *struct.unpack("<4I", raw))
+        return f"{socket.inet_ntop(family, raw)}:{port}"
+    
+    def _linux_inet_connections(self, limit: int, proc_root: str = "/proc") -> List[Dict[str, Any]]:
+        """Read up to limit connections straight from /proc/net/{tcp,udp}{,6}
+        
+        psutil.net_connections parses every socket on the host and maps every
+        inode to a pid before returning; here parsing stops after limit sockets
+        and only their inodes are looked up.
+        """
+        connections = []
+        inodes = {}
+        for name, family, kind in (
+            ("tcp", socket.AF_INET, socket.SOCK_STREAM),
+            ("tcp6", socket.AF_INET6, socket.SOCK_STREAM),
+            ("udp", socket.AF_INET, socket.SOCK_DGRAM),
+            ("udp6", socket.AF_INET6, socket.SOCK_DGRAM),
+        ):
+            try:
+                f = open(f"{proc_root}/net/{name}")
+            except OSError:  # No IPv6 support, etc.
+                continue
+            with f:
+                next(f, None)  # Header
+                for line in f:
+                    fields = line.split()
+                    conn = {
+                        "family": FAMILY_NAMES[family],
+                        "type": SOCKET_TYPES[kind],
+                        "local_address": self._decode_proc_net_address(fields[1], family),
+                        "remote_address": self._decode_proc_net_address(fields[2], family),
+                        "status": LINUX_TCP_STATES.get(fields[3], "NONE") if kind == socket.SOCK_STREAM else "NONE",
+                        "pid": None
+                    }
+                    connections.append(conn)
+                    # TIME_WAIT and other orphaned sockets have inode 0 and
+                    # no owning fd, so there is nothing to look up
+                    if fields[9] != "0":
+                        inodes[f"socket:[{fields[9]}]"] = conn
+                    if len(connections) >= limit:
+                        break
+            if len(connections) >= limit:
+                break
+        
+        # Resolve owning pids by scanning fds until every wanted inode is found
+        remaining = len(inodes)
+        for entry in os.listdir(proc_root):
+            if not remaining:
+                break
+            if not entry.isdigit():
+                continue
+            fd_dir = f"{proc_root}/{entry}/fd"
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:  # Exited, or another user's process
+                continue
+            for fd in fds:
+                try:
+                    conn = inodes.get(os.readlink(f"{fd_dir}/{fd}"))
+                except OSError:
+                    continue
+                if conn is not None and conn["pid"] is None:
+                    conn["pid"] = int(entry)
+                    remaining -= 1
+        
+        return connections
+    
+    @_timed("get_processes")
     async def get_processes(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get running processes information"""
         try:
-            sort_by = arguments.get("sort_by", "cpu")
-            limit = arguments.get("limit", 20)
-            
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 
-                                           'status', 'create_time', 'num_threads']):
-                try:
-                    pinfo = proc.info
-                    processes.append({
-                        "pid": pinfo['pid'],
-                        "name": pinfo['name'],
-                        "cpu_percent": round(pinfo['cpu_percent'], 2),
-                        "memory_percent": round(pinfo['memory_percent'], 2),
-                        "status": pinfo['status'],
-                        "threads": pinfo['num_threads'],
-                        "created": datetime.fromtimestamp(pinfo['create_time']).strftime('%Y-%m-%d %H:%M:%S')
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort processes
-            if sort_by == "cpu":
-                processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            elif sort_by == "memory":
-                processes.sort(key=lambda x: x['memory_percent'], reverse=True)
-            elif sort_by == "name":
-                processes.sort(key=lambda x: x['name'])
-            elif sort_by == "pid":
-                processes.sort(key=lambda x: x['pid'])
+            result = await self._run_blocking(self._collect_processes, arguments)
             
+            # Long lists (processes, applications, logs) are sent compact;
+            # indentation would roughly double the payload clients parse
             return [types.TextContent(
                 type="text",
-                text=json.dumps({"processes": processes[:limit], "total": len(processes)}, indent=2)
+                text=dumps(result, indent=False)
             )]
         except Exception as e:
             logger.error(f"Error getting processes: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
     
+    def _collect_processes(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect running processes (blocking; run via _run_blocking)"""
+        sort_by = arguments.get("sort_by", "cpu")
+        limit = arguments.get("limit", 20)
+        
+        if self.os_type == "Linux":
+            processes = self._collect_linux_processes(sort_by)
+        else:
+            procs, new = self._live_procs()
+            if sort_by == "cpu" and new:
+                # Processes seen for the first time were just primed; give them a
+                # short window so their cpu_percent isn't a meaningless 0.0
+                time.sleep(PROC_CPU_WARMUP)
+            
+            # oneshot() reads each process's Windows/macOS process snapshot
+            # once for all the fields below
+            processes = []
+            for proc in procs:
+                try:
+                    with proc.oneshot():
+                        processes.append({
+                            "pid": proc.pid,
+                            "name": proc.name(),
+                            "cpu_percent": round(proc.cpu_percent(None), 2),
+                            "memory_percent": round(proc.memory_percent(), 2),
+                            "status": proc.status(),
+                            "threads": proc.num_threads(),
+                            "created": datetime.fromtimestamp(proc.create_time()).strftime('%Y-%m-%d %H:%M:%S')
+                        })
+                except psutil.NoSuchProcess:
+                    self._forget_proc(proc.pid)
+                except psutil.AccessDenied:
+                    pass
+        
+        # Only the top `limit` entries are returned, so select them with a
+        # bounded heap instead of sorting the whole list
+        if sort_by == "cpu":
+            top = heapq.nlargest(limit, processes, key=lambda x: x['cpu_percent'])
+        elif sort_by == "memory":
+            top = heapq.nlargest(limit, processes, key=lambda x: x['memory_percent'])
+        elif sort_by == "name":
+            top = heapq.nsmallest(limit, processes, key=lambda x: x['name'])
+        elif sort_by == "pid":
+            top = heapq.nsmallest(limit, processes, key=lambda x: x['pid'])
+        else:
+            top = processes[:limit]
+        
+        return {"processes": top, "total": len(processes)}
+    
+    @_timed("get_installed_applications")
     async def get_installed_applications(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get installed applications"""
         try:
-            applications = []
-            
             if self.os_type == "Windows":
-                applications = self._get_windows_applications()
+                collect = self._get_windows_applications
             elif self.os_type == "Darwin":
-                applications = self._get_macos_applications()
+                collect = self._get_macos_applications
             else:  # Linux
-                applications = self._get_linux_applications()
+                collect = self._get_linux_applications
+            
+            applications = await self._cached_async(
+                "applications", APPLICATIONS_TTL, self._run_blocking, collect
+            )
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({"applications": applications, "total": len(applications)}, indent=2)
+                text=dumps({"applications": applications, "total": len(applications)}, indent=False)
             )]
         except Exception as e:
             logger.error(f"Error getting installed applications: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
     
     def _get_windows_applications(self) -> List[Dict[str, Any]]:
         """Get Windows installed applications"""
@@ -692,112 +1985,158 @@ class SystemDiagnosticsServer:
         try:
             import winreg
             
-            # Check both 32-bit and 64-bit registry keys
-            keys = [
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
-                r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
-            ]
-            
-            for key_path in keys:
+            # Read the 64-bit and 32-bit registry views explicitly instead of
+            # relying on WOW64 redirection, which depends on the interpreter's
+            # bitness (32-bit Windows only has the one view)
+            views = [winreg.KEY_WOW64_64KEY]
+            if self._static_info.architecture.endswith("64"):
+                views.append(winreg.KEY_WOW64_32KEY)
+            
+            subkey_paths = []
+            subkey_access = []
+            for view in views:
+                access = winreg.KEY_READ | view
                 try:
-                    key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path)
-                    for i in range(winreg.QueryInfoKey(key)[0]):
-                        try:
-                            subkey_name = winreg.EnumKey(key, i)
-                            subkey = winreg.OpenKey(key, subkey_name)
-                            
-                            app_info = {}
-                            try:
-                                app_info["name"] = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                                app_info["version"] = winreg.QueryValueEx(subkey, "DisplayVersion")[0]
-                            except:
-                                continue
-                            
-                            try:
-                                app_info["publisher"] = winreg.QueryValueEx(subkey, "Publisher")[0]
-                            except:
-                                app_info["publisher"] = "Unknown"
-                            
-                            try:
-                                app_info["install_date"] = winreg.QueryValueEx(subkey, "InstallDate")[0]
-                            except:
-                                app_info["install_date"] = "Unknown"
-                            
-                            applications.append(app_info)
-                            winreg.CloseKey(subkey)
-                        except:
-                            continue
-                    winreg.CloseKey(key)
-                except:
+                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, UNINSTALL_KEY, 0, access) as key:
+                        enum_key = winreg.EnumKey
+                        for i in range(winreg.QueryInfoKey(key)[0]):
+                            subkey_paths.append(f"{UNINSTALL_KEY}\\{enum_key(key, i)}")
+                            subkey_access.append(access)
+                except OSError:
                     continue
+            
+            # Registry reads wait on the kernel rather than the GIL, so
+            # overlap them; each worker opens its own handles
+            with ThreadPoolExecutor(max_workers=REGISTRY_WORKERS) as pool:
+                entries = pool.map(self._read_uninstall_subkey, subkey_paths, subkey_access)
+                applications = [entry for entry in entries if entry is not None]
         except ImportError:
             pass
         
         return applications
     
+    @classmethod
+    def _read_uninstall_subkey(cls, path: str, access: int) -> Optional[Dict[str, Any]]:
+        """Open an HKLM Uninstall subkey and read its display values"""
+        import winreg
+        
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, access) as subkey:
+                return cls._read_uninstall_entry(subkey)
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _read_uninstall_entry(subkey) -> Optional[Dict[str, Any]]:
+        """Read an Uninstall subkey's display values in one enumeration pass
+        
+        Returns None for entries without a DisplayName and DisplayVersion
+        (updates, components and other hidden entries).
+        """
+        import winreg
+        
+        values = {}
+        enum_value = winreg.EnumValue
+        for i in range(winreg.QueryInfoKey(subkey)[1]):
+            name, value, value_type = enum_value(subkey, i)
+            # The display values are all strings; skip DWORD/binary data
+            if value_type in STRING_VALUE_TYPES and name in UNINSTALL_VALUES:
+                values[name] = value
+        
+        if "DisplayName" not in values or "DisplayVersion" not in values:
+            return None
+        return {
+            "name": values["DisplayName"],
+            "version": values["DisplayVersion"],
+            "publisher": values.get("Publisher", "Unknown"),
+            "install_date": values.get("InstallDate", "Unknown")
+        }
+    
     def _get_macos_applications(self) -> List[Dict[str, Any]]:
         """Get macOS installed applications"""
         applications = []
         try:
-            apps_dir = "/Applications"
-            for app in os.listdir(apps_dir):
-                if app.endswith(".app"):
-                    app_path = os.path.join(apps_dir, app)
-                    info_plist = os.path.join(app_path, "Contents", "Info.plist")
-                    
-                    if os.path.exists(info_plist):
-                        try:
-                            with open(info_plist, 'rb') as f:
-                                plist = plistlib.load(f)
-                                app_info = {
-                                    "name": plist.get("CFBundleName", app[:-4]),
-                                    "version": plist.get("CFBundleShortVersionString", "Unknown"),
-                                    "identifier": plist.get("CFBundleIdentifier", "Unknown")
-                                }
-                                applications.append(app_info)
-                        except:
-                            applications.append({"name": app[:-4], "version": "Unknown"})
-        except:
+            with os.scandir("/Applications") as entries:
+                # is_dir() is answered from the directory listing, not a stat
+                bundles = [entry for entry in entries if entry.name.endswith(".app") and entry.is_dir()]
+            
+            # Each bundle costs a file read and a plist parse; overlap them
+            if bundles:
+                with ThreadPoolExecutor(max_workers=min(32, len(bundles))) as pool:
+                    applications = [app for app in pool.map(self._read_app_bundle, bundles) if app is not None]
+        except OSError:
             pass
         
         return applications
     
+    @staticmethod
+    def _read_app_bundle(bundle: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """Read name, version and identifier from an .app bundle's Info.plist"""
+        name = bundle.name[:-4]
+        try:
+            # Opening directly doubles as the existence check
+            with open(f"{bundle.path}/Contents/Info.plist", 'rb') as f:
+                plist = _load_plist(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Unreadable or malformed plist (plistlib raises several types)
+            return {"name": name, "version": "Unknown"}
+        return {
+            "name": plist.get("CFBundleName", name),
+            "version": plist.get("CFBundleShortVersionString", "Unknown"),
+            "identifier": plist.get("CFBundleIdentifier", "Unknown")
+        }
+    
     def _get_linux_applications(self) -> List[Dict[str, Any]]:
         """Get Linux installed applications"""
-        applications = []
         try:
-            # Try dpkg for Debian-based systems
-            result = subprocess.run(
-                ["dpkg", "-l"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                for line in result.stdout.split('\n')[5:]:  # Skip header
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        applications.append({
-                            "name": parts[1],
-                            "version": parts[2],
-                            "description": " ".join(parts[3:]) if len(parts) > 3 else ""
-                        })
-        except:
-            # Try rpm for Red Hat-based systems
+            mtime = os.stat(DPKG_STATUS_PATH).st_mtime_ns
+        except OSError:
+            # No dpkg database; try rpm for Red Hat-based systems
+            applications = []
             try:
                 result = subprocess.run(
-                    ["rpm", "-qa"],
+                    ["rpm", "-qa", "--qf", "%{NAME}\t%{VERSION}-%{RELEASE}\t%{SUMMARY}\n"],
                     capture_output=True,
                     text=True
                 )
                 if result.returncode == 0:
                     for line in result.stdout.split('\n'):
                         if line:
-                            applications.append({"name": line, "version": "Unknown"})
-            except:
+                            name, _, rest = line.partition("\t")
+                            version, _, summary = rest.partition("\t")
+                            applications.append({
+                                "name": name,
+                                "version": version or "Unknown",
+                                "description": summary
+                            })
+            except (OSError, subprocess.SubprocessError):
                 pass
+            return applications
+        
+        # The package database only changes when dpkg runs, which bumps mtime
+        if self._dpkg_cache is not None and self._dpkg_cache[0] == mtime:
+            return self._dpkg_cache[1]
+        
+        with open(DPKG_STATUS_PATH, "rb") as f:
+            data = f.read()
         
+        applications = []
+        for stanza in data.split(b"\n\n"):
+            fields = dict(DPKG_FIELD_RE.findall(stanza))
+            if b"Package" not in fields or not fields.get(b"Status", b"").endswith(b" installed"):
+                continue
+            applications.append({
+                "name": fields[b"Package"].decode("utf-8", "replace"),
+                "version": fields.get(b"Version", b"Unknown").decode("utf-8", "replace"),
+                "description": fields.get(b"Description", b"").decode("utf-8", "replace")
+            })
+        
+        self._dpkg_cache = (mtime, applications)
         return applications
     
+    @_timed("get_battery_status")
     async def get_battery_status(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get battery status and power information"""
         try:
@@ -806,7 +2145,7 @@ class SystemDiagnosticsServer:
             if battery is None:
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps({"status": "No battery detected (desktop system)"}, indent=2)
+                    text=dumps({"status": "No battery detected (desktop system)"})
                 )]
             
             status = {
@@ -822,52 +2161,59 @@ class SystemDiagnosticsServer:
             else:
                 status["time_remaining"] = "Calculating..." if not battery.power_plugged else "Plugged in"
             
-            # Get power-hungry processes
+            # Get power-hungry processes, reusing the per-process readings of
+            # a diagnose_performance run that just finished
+            if self._proc_snapshot is not None and time.monotonic() - self._proc_snapshot[0] < PROC_SNAPSHOT_MAX_AGE:
+                readings = self._proc_snapshot[1]
+            else:
+                readings = []
+                for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
+                    readings.append(proc.info)
+            
             power_hungry = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-                try:
-                    if proc.info['cpu_percent'] > 5:  # Processes using more than 5% CPU
-                        power_hungry.append({
-                            "name": proc.info['name'],
-                            "pid": proc.info['pid'],
-                            "cpu_percent": proc.info['cpu_percent']
-                        })
-                except:
-                    pass
+            for pinfo in readings:
+                if (pinfo['cpu_percent'] or 0) > 5:  # Processes using more than 5% CPU
+                    power_hungry.append({
+                        "name": pinfo['name'],
+                        "pid": pinfo['pid'],
+                        "cpu_percent": pinfo['cpu_percent']
+                    })
             
-            power_hungry.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            status["power_hungry_processes"] = power_hungry[:5]
+            status["power_hungry_processes"] = heapq.nlargest(5, power_hungry, key=lambda x: x['cpu_percent'])
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(status, indent=2)
+                text=dumps(status)
             )]
         except Exception as e:
             logger.error(f"Error getting battery status: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
     
+    @_timed("get_system_logs")
     async def get_system_logs(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get system logs"""
         try:
             log_type = arguments.get("log_type", "system")
             limit = arguments.get("limit", 100)
             
-            logs = []
-            
             if self.os_type == "Windows":
-                logs = self._get_windows_logs(log_type, limit)
+                collect = self._get_windows_logs
             elif self.os_type == "Darwin":
-                logs = self._get_macos_logs(log_type, limit)
+                collect = self._get_macos_logs
             else:
-                logs = self._get_linux_logs(log_type, limit)
+                collect = self._get_linux_logs
+            
+            # The readers wait on event log APIs and child processes; run
+            # them off the event loop so other tool calls keep being served
+            logs = await self._run_blocking(collect, log_type, limit)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({"logs": logs, "count": len(logs)}, indent=2)
+                text=dumps({"logs": logs, "count": len(logs)}, indent=False)
             )]
         except Exception as e:
             logger.error(f"Error getting system logs: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
     
     def _get_windows_logs(self, log_type: str, limit: int) -> List[Dict[str, Any]]:
         """Get Windows event logs"""
@@ -880,36 +2226,50 @@ class SystemDiagnosticsServer:
             hand = win32evtlog.OpenEventLog(server, logtype)
             flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
             
-            events = win32evtlog.ReadEventLog(hand, flags, 0)
-            for event in events[:limit]:
-                logs.append({
-                    "time": str(event.TimeGenerated),
-                    "source": event.SourceName,
-                    "event_id": event.EventID,
-                    "category": event.EventCategory,
-                    "type": event.EventType,
-                    "message": str(event.StringInserts) if event.StringInserts else ""
-                })
-            
-            win32evtlog.CloseEventLog(hand)
+            # Each ReadEventLog call returns one buffer's worth of records,
+            # often fewer than limit; keep reading until enough are collected
+            try:
+                while len(logs) < limit:
+                    events = win32evtlog.ReadEventLog(hand, flags, 0)
+                    if not events:
+                        break
+                    for event in events[:limit - len(logs)]:
+                        logs.append({
+                            "time": str(event.TimeGenerated),
+                            "source": event.SourceName,
+                            "event_id": event.EventID,
+                            "category": event.EventCategory,
+                            "type": event.EventType,
+                            "message": str(event.StringInserts) if event.StringInserts else ""
+                        })
+            finally:
+                win32evtlog.CloseEventLog(hand)
         except ImportError:
-            # Fallback to PowerShell if win32evtlog is not available
+            # Fall back to wevtutil if win32evtlog is not available; it starts
+            # far faster than PowerShell and renders events as XML
             try:
+                logtype = 'System' if log_type == 'system' else 'Application'
                 result = subprocess.run(
-                    ["powershell", f"Get-EventLog -LogName {log_type} -Newest {limit} | ConvertTo-Json"],
-                    capture_output=True,
-                    text=True
+                    ["wevtutil", "qe", logtype, f"/c:{limit}", "/rd:true", "/f:RenderedXml"],
+                    capture_output=True
                 )
                 if result.returncode == 0:
-                    import json
-                    events = json.loads(result.stdout)
-                    for event in events:
+                    # The output is a run of <Event> elements with no root
+                    xml = io.BytesIO(b"<Events>" + result.stdout + b"</Events>")
+                    for _, event in ElementTree.iterparse(xml):
+                        if event.tag != EVENT_NS + "Event":
+                            continue
+                        system = event.find(EVENT_NS + "System")
+                        time_created = system.find(EVENT_NS + "TimeCreated")
+                        provider = system.find(EVENT_NS + "Provider")
                         logs.append({
-                            "time": event.get("TimeGenerated", ""),
-                            "source": event.get("Source", ""),
-                            "message": event.get("Message", "")
+                            "time": time_created.get("SystemTime", "") if time_created is not None else "",
+                            "source": provider.get("Name", "") if provider is not None else "",
+                            "event_id": int(system.findtext(EVENT_NS + "EventID") or 0),
+                            "message": event.findtext(f"{EVENT_NS}RenderingInfo/{EVENT_NS}Message", "")
                         })
-            except:
+                        event.clear()
+            except (OSError, ElementTree.ParseError, ValueError):
                 pass
         
         return logs
@@ -935,7 +2295,7 @@ class SystemDiagnosticsServer:
                                 "type": parts[2],
                                 "message": parts[3]
                             })
-        except:
+        except OSError:
             pass
         
         return logs
@@ -944,296 +2304,298 @@ class SystemDiagnosticsServer:
         """Get Linux system logs"""
         logs = []
         try:
-            # Try journalctl first
-            result = subprocess.run(
-                ["journalctl", "-n", str(limit), "--no-pager", "-o", "json"],
-                capture_output=True,
-                text=True
-            )
+            # Try journalctl first, asking only for the fields we report and
+            # parsing entries as they arrive instead of buffering all output
+            try:
+                proc = subprocess.Popen(
+                    ["journalctl", "-n", str(limit), "--no-pager", "-o", "json",
+                     "--output-fields=" + JOURNAL_FIELDS],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=1 << 20
+                )
+            except OSError:
+                # No journalctl (non-systemd distributions)
+                proc = None
             
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line:
+            if proc is not None:
+                with proc:
+                    for line in proc.stdout:
                         try:
-                            entry = json.loads(line)
+                            entry = loads(line)
                             logs.append({
-                                "time": datetime.fromtimestamp(int(entry.get("__REALTIME_TIMESTAMP", 0)) / 1000000).isoformat(),
+                                "time": _journal_time(entry.get("__REALTIME_TIMESTAMP", 0)),
                                 "priority": entry.get("PRIORITY", ""),
                                 "unit": entry.get("_SYSTEMD_UNIT", ""),
                                 "message": entry.get("MESSAGE", "")
                             })
-                        except:
+                        except (ValueError, OverflowError, OSError):
+                            # Malformed line or out-of-range timestamp
                             pass
-            else:
-                # Fallback to /var/log files
+            
+            if not logs:
+                # Fallback to /var/log files when the journal gave nothing;
+                # a non-zero exit after some entries (SIGPIPE, a truncated
+                # journal) keeps them rather than mixing in syslog lines
                 log_file = "/var/log/syslog" if os.path.exists("/var/log/syslog") else "/var/log/messages"
-                if os.path.exists(log_file):
-                    with open(log_file, 'r') as f:
-                        lines = f.readlines()[-limit:]
-                        for line in lines:
-                            logs.append({"message": line.strip()})
-        except:
+                for line in self._tail_lines(log_file, limit):
+                    match = SYSLOG_LINE_RE.match(line)
+                    if match:
+                        logs.append({
+                            "time": match.group(1),
+                            "host": match.group(2),
+                            "source": match.group(3),
+                            "message": match.group(4)
+                        })
+                    else:
+                        logs.append({"message": line.strip()})
+        except (OSError, ValueError):
             pass
         
         return logs
     
+    @staticmethod
+    def _tail_lines(path: str, limit: int) -> List[str]:
+        """Return the last limit lines of a file
+        
+        Maps the file and scans back from the end for newlines, so only the
+        tail is read however large the log has grown.
+        """
+        with open(path, 'rb') as f:
+            if limit <= 0 or os.fstat(f.fileno()).st_size == 0:
+                return []
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                end = len(mm)
+                if mm[end - 1:end] == b"\n":
+                    end -= 1
+                start = end
+                for _ in range(limit):
+                    start = mm.rfind(b"\n", 0, start)
+                    if start < 0:
+                        break
+                start += 1
+                return mm[start:end].decode("utf-8", "replace").splitlines()
+            finally:
+                mm.close()
+    
+    @_timed("diagnose_performance")
     async def diagnose_performance(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Run performance diagnostics"""
         try:
-            duration = arguments.get("duration", 5)
-            
-            # Initial snapshot
-            cpu_before = psutil.cpu_percent(interval=1)
-            mem_before = psutil.virtual_memory().percent
-            disk_io_before = psutil.disk_io_counters()
-            net_io_before = psutil.net_io_counters()
-            
-            # Monitor for specified duration
-            cpu_samples = []
-            mem_samples = []
-            for _ in range(duration):
-                cpu_samples.append(psutil.cpu_percent(interval=1))
-                mem_samples.append(psutil.virtual_memory().percent)
-            
-            # Final snapshot
-            disk_io_after = psutil.disk_io_counters()
-            net_io_after = psutil.net_io_counters()
-            
-            # Analysis
-            avg_cpu = sum(cpu_samples) / len(cpu_samples)
-            max_cpu = max(cpu_samples)
-            avg_mem = sum(mem_samples) / len(mem_samples)
-            max_mem = max(mem_samples)
-            
-            # Calculate I/O rates
-            disk_read_rate = (disk_io_after.read_bytes - disk_io_before.read_bytes) / duration / (1024**2)  # MB/s
-            disk_write_rate = (disk_io_after.write_bytes - disk_io_before.write_bytes) / duration / (1024**2)  # MB/s
-            net_recv_rate = (net_io_after.bytes_recv - net_io_before.bytes_recv) / duration / (1024**2)  # MB/s
-            net_sent_rate = (net_io_after.bytes_sent - net_io_before.bytes_sent) / duration / (1024**2)  # MB/s
-            
-            # Identify bottlenecks
-            bottlenecks = []
-            recommendations = []
-            
-            if avg_cpu > 80:
-                bottlenecks.append("HIGH_CPU_USAGE")
-                recommendations.append("CPU is heavily utilized. Consider upgrading CPU or optimizing running applications.")
-            
-            if avg_mem > 85:
-                bottlenecks.append("HIGH_MEMORY_USAGE")
-                recommendations.append("Memory usage is high. Consider adding more RAM or closing memory-intensive applications.")
-            
-            if disk_read_rate > 100 or disk_write_rate > 100:
-                bottlenecks.append("HIGH_DISK_IO")
-                recommendations.append("High disk I/O detected. Consider upgrading to SSD or optimizing disk-intensive operations.")
-            
-            # Get top resource consumers
-            top_cpu_procs = []
-            top_mem_procs = []
-            
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    pinfo = proc.info
-                    if pinfo['cpu_percent'] > 10:
-                        top_cpu_procs.append({
-                            "name": pinfo['name'],
-                            "pid": pinfo['pid'],
-                            "cpu_percent": pinfo['cpu_percent']
-                        })
-                    if pinfo['memory_percent'] > 5:
-                        top_mem_procs.append({
-                            "name": pinfo['name'],
-                            "pid": pinfo['pid'],
-                            "memory_percent": pinfo['memory_percent']
-                        })
-                except:
-                    pass
-            
-            top_cpu_procs.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            top_mem_procs.sort(key=lambda x: x['memory_percent'], reverse=True)
-            
-            diagnostics = {
-                "duration_seconds": duration,
-                "metrics": {
-                    "cpu": {
-                        "average_percent": round(avg_cpu, 2),
-                        "max_percent": round(max_cpu, 2)
-                    },
-                    "memory": {
-                        "average_percent": round(avg_mem, 2),
-                        "max_percent": round(max_mem, 2)
-                    },
-                    "disk_io": {
-                        "read_rate_mb_s": round(disk_read_rate, 2),
-                        "write_rate_mb_s": round(disk_write_rate, 2)
-                    },
-                    "network_io": {
-                        "receive_rate_mb_s": round(net_recv_rate, 2),
-                        "send_rate_mb_s": round(net_sent_rate, 2)
-                    }
-                },
-                "bottlenecks": bottlenecks,
-                "recommendations": recommendations,
-                "top_cpu_processes": top_cpu_procs[:5],
-                "top_memory_processes": top_mem_procs[:5]
-            }
+            diagnostics = await self._collect_diagnostics(arguments)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(diagnostics, indent=2)
+                text=dumps(diagnostics)
             )]
         except Exception as e:
             logger.error(f"Error running diagnostics: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
     
-    async def get_hardware_recommendations(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
-        """Get hardware upgrade recommendations"""
-        try:
-            use_case = arguments.get("use_case", "general")
-            
-            # Get current system specs
-            cpu_count = psutil.cpu_count(logical=False)
-            total_ram = psutil.virtual_memory().total / (1024**3)
-            
-            # Get motherboard info (platform-specific)
-            motherboard_info = self._get_motherboard_info()
-            
-            recommendations = {
-                "current_specs": {
-                    "cpu_cores": cpu_count,
-                    "ram_gb": round(total_ram, 2),
-                    "motherboard": motherboard_info
-                },
-                "upgrade_recommendations": []
-            }
-            
-            # Use case specific recommendations
-            if use_case == "gaming":
-                if cpu_count < 6:
-                    recommendations["upgrade_recommendations"].append({
-                        "component": "CPU",
-                        "reason": "Gaming benefits from 6+ cores for modern titles",
-                        "suggestion": "Consider AMD Ryzen 5 5600X or Intel Core i5-12600K"
-                    })
-                if total_ram < 16:
-                    recommendations["upgrade_recommendations"].append({
-                        "component": "RAM",
-                        "reason": "16GB minimum recommended for gaming",
-                        "suggestion": "Upgrade to 16GB DDR4 3200MHz or higher"
-                    })
-                recommendations["upgrade_recommendations"].append({
-                    "component": "GPU",
-                    "reason": "Graphics card is crucial for gaming performance",
-                    "suggestion": "Consider RTX 4060 Ti or RX 7700 XT for 1080p/1440p gaming"
-                })
-                
-            elif use_case == "content_creation":
-                if cpu_count < 8:
-                    recommendations["upgrade_recommendations"].append({
-                        "component": "CPU",
-                        "reason": "Content creation benefits from 8+ cores",
-                        "suggestion": "Consider AMD Ryzen 7 5800X or Intel Core i7-12700K"
-                    })
-                if total_ram < 32:
-                    recommendations["upgrade_recommendations"].append({
-                        "component": "RAM",
-                        "reason": "32GB+ recommended for video editing and 3D rendering",
-                        "suggestion": "Upgrade to 32GB DDR4 3600MHz"
-                    })
-                recommendations["upgrade_recommendations"].append({
-                    "component": "Storage",
-                    "reason": "Fast storage crucial for large file handling",
-                    "suggestion": "Add NVMe SSD (Samsung 980 Pro or WD Black SN850)"
-                })
-                
-            elif use_case == "development":
-                if total_ram < 16:
-                    recommendations["upgrade_recommendations"].append({
-                        "component": "RAM",
-                        "reason": "16GB+ recommended for running VMs and containers",
-                        "suggestion": "Upgrade to 16GB or 32GB DDR4"
-                    })
-                recommendations["upgrade_recommendations"].append({
-                    "component": "Storage",
-                    "reason": "Fast storage improves build times",
-                    "suggestion": "NVMe SSD for OS and development tools"
-                })
-                
-            elif use_case == "productivity":
-                if total_ram < 8:
-                    recommendations["upgrade_recommendations"].append({
-                        "component": "RAM",
-                        "reason": "8GB minimum for smooth multitasking",
-                        "suggestion": "Upgrade to 8GB or 16GB DDR4"
+    async def _collect_diagnostics(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Sample the system for duration seconds and build the diagnostics report"""
+        duration = arguments.get("duration", 5)
+        
+        # Initial snapshot. Take the system-wide CPU times and prime the
+        # per-process counters so every reading below covers the time since
+        # the previous one, and per-process usage spans the whole run
+        cpu_times = psutil.cpu_times()
+        procs = list(psutil.process_iter(['pid', 'name']))
+        for proc in procs:
+            try:
+                proc.cpu_percent(None)
+            except psutil.Error:
+                pass
+        io_before = IOSample.capture()
+        
+        # Monitor for specified duration, yielding to the event loop
+        # between one-second samples; keep running totals and peaks
+        # rather than the samples themselves
+        cpu_total = max_cpu = 0.0
+        mem_total = max_mem = 0.0
+        for _ in range(duration):
+            await asyncio.sleep(1)
+            cpu_times, previous = psutil.cpu_times(), cpu_times
+            cpu = _cpu_busy_percent(previous, cpu_times)
+            mem = psutil.virtual_memory().percent
+            cpu_total += cpu
+            mem_total += mem
+            if cpu > max_cpu:
+                max_cpu = cpu
+            if mem > max_mem:
+                max_mem = mem
+        
+        # Final snapshot
+        io_after = IOSample.capture()
+        
+        snapshot = []
+        for proc in procs:
+            try:
+                with proc.oneshot():
+                    snapshot.append({
+                        "name": proc.info['name'],
+                        "pid": proc.pid,
+                        "cpu_percent": proc.cpu_percent(None),
+                        "memory_percent": proc.memory_percent()
                     })
-                recommendations["upgrade_recommendations"].append({
-                    "component": "Storage",
-                    "reason": "SSD significantly improves system responsiveness",
-                    "suggestion": "Replace HDD with SATA SSD (Samsung 870 EVO or Crucial MX500)"
-                })
-            
-            # General recommendations based on system analysis
-            vm = psutil.virtual_memory()
-            if vm.percent > 80:
-                recommendations["upgrade_recommendations"].append({
-                    "component": "RAM",
-                    "reason": f"Current memory usage is {vm.percent}% - system would benefit from more RAM",
-                    "suggestion": f"Add {16 if total_ram < 16 else 32}GB RAM"
+            except psutil.Error:
+                pass
+        self._proc_snapshot = (time.monotonic(), snapshot)
+        
+        # Analysis
+        avg_cpu = cpu_total / duration
+        avg_mem = mem_total / duration
+        
+        # Calculate I/O rates
+        rates = io_after.rates(io_before, duration)  # MB/s
+        disk_read_rate = rates["read"]
+        disk_write_rate = rates["write"]
+        net_recv_rate = rates["recv"]
+        net_sent_rate = rates["sent"]
+        busiest_disk = io_after.busiest_disk(io_before, duration)
+        
+        # Identify bottlenecks
+        bottlenecks = []
+        recommendations = []
+        
+        if avg_cpu > 80:
+            bottlenecks.append("HIGH_CPU_USAGE")
+            recommendations.append("CPU is heavily utilized. Consider upgrading CPU or optimizing running applications.")
+        
+        if avg_mem > 85:
+            bottlenecks.append("HIGH_MEMORY_USAGE")
+            recommendations.append("Memory usage is high. Consider adding more RAM or closing memory-intensive applications.")
+        
+        if disk_read_rate > 100 or disk_write_rate > 100:
+            bottlenecks.append("HIGH_DISK_IO")
+            recommendations.append("High disk I/O detected. Consider upgrading to SSD or optimizing disk-intensive operations.")
+        
+        # Get top resource consumers
+        top_cpu_procs = []
+        top_mem_procs = []
+        
+        for pinfo in snapshot:
+            if pinfo['cpu_percent'] > 10:
+                top_cpu_procs.append({
+                    "name": pinfo['name'],
+                    "pid": pinfo['pid'],
+                    "cpu_percent": pinfo['cpu_percent']
                 })
-            
-            # Check for SSD
-            has_ssd = False
-            for partition in psutil.disk_partitions():
-                try:
-                    if self.os_type == "Windows":
-                        if self._get_windows_drive_type(partition.device) == "SSD":
-                            has_ssd = True
-                            break
-                except:
-                    pass
-            
-            if not has_ssd:
-                recommendations["upgrade_recommendations"].append({
-                    "component": "Storage",
-                    "reason": "No SSD detected - SSD provides major performance improvement",
-                    "suggestion": "Add 500GB+ NVMe or SATA SSD for OS and applications"
+            if pinfo['memory_percent'] > 5:
+                top_mem_procs.append({
+                    "name": pinfo['name'],
+                    "pid": pinfo['pid'],
+                    "memory_percent": pinfo['memory_percent']
                 })
-            
-            recommendations["compatibility_notes"] = [
-                "Check motherboard compatibility before purchasing RAM (DDR3/DDR4/DDR5)",
-                "Verify power supply wattage before GPU upgrade",
-                "Ensure motherboard has M.2 slot for NVMe SSDs",
-                "Consider case dimensions for GPU upgrades"
-            ]
+        
+        top_cpu_procs = heapq.nlargest(5, top_cpu_procs, key=lambda x: x['cpu_percent'])
+        top_mem_procs = heapq.nlargest(5, top_mem_procs, key=lambda x: x['memory_percent'])
+        
+        diagnostics = {
+            "duration_seconds": duration,
+            "metrics": {
+                "cpu": {
+                    "average_percent": round(avg_cpu, 2),
+                    "max_percent": round(max_cpu, 2)
+                },
+                "memory": {
+                    "average_percent": round(avg_mem, 2),
+                    "max_percent": round(max_mem, 2)
+                },
+                "disk_io": {
+                    "read_rate_mb_s": round(disk_read_rate, 2),
+                    "write_rate_mb_s": round(disk_write_rate, 2),
+                    "busiest_device": busiest_disk[0] if busiest_disk else None,
+                    "busiest_device_rate_mb_s": round(busiest_disk[1], 2) if busiest_disk else 0
+                },
+                "network_io": {
+                    "receive_rate_mb_s": round(net_recv_rate, 2),
+                    "send_rate_mb_s": round(net_sent_rate, 2)
+                }
+            },
+            "bottlenecks": bottlenecks,
+            "recommendations": recommendations,
+            "top_cpu_processes": top_cpu_procs,
+            "top_memory_processes": top_mem_procs
+        }
+        
+        return diagnostics
+    
+    @_timed("get_hardware_recommendations")
+    async def get_hardware_recommendations(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """Get hardware upgrade recommendations"""
+        try:
+            recommendations = await self._collect_recommendations(arguments)
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps(recommendations, indent=2)
+                text=dumps(recommendations)
             )]
         except Exception as e:
             logger.error(f"Error getting hardware recommendations: {e}")
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return _error_result(f"Error: {str(e)}")
+    
+    async def _collect_recommendations(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the upgrade recommendations for the requested use case"""
+        use_case = arguments.get("use_case", "general")
+        
+        # Get current system specs
+        cpu_count = psutil.cpu_count(logical=False)
+        vm = psutil.virtual_memory()
+        total_ram = vm.total / (1024**3)
+        
+        # Get motherboard info (platform-specific)
+        motherboard_info = await self._get_motherboard_info()
+        
+        recommendations = {
+            "current_specs": {
+                "cpu_cores": cpu_count,
+                "ram_gb": round(total_ram, 2),
+                "motherboard": motherboard_info
+            },
+            "upgrade_recommendations": []
+        }
+        
+        # Use case specific recommendations
+        specs = {"cpu_cores": cpu_count or 0, "ram_gb": total_ram}
+        for spec, minimum, recommendation in USE_CASE_RECOMMENDATIONS.get(use_case, ()):
+            if spec is None or specs[spec] < minimum:
+                recommendations["upgrade_recommendations"].append(recommendation)
+        
+        # General recommendations based on system analysis
+        if vm.percent > 80:
+            recommendations["upgrade_recommendations"].append({
+                "component": "RAM",
+                "reason": f"Current memory usage is {vm.percent}% - system would benefit from more RAM",
+                "suggestion": f"Add {16 if total_ram < 16 else 32}GB RAM"
+            })
+        
+        # Check for SSD
+        ssd_map = await self._cached_async(
+            "ssd_map", DRIVE_TYPE_TTL, self._run_blocking, self._ssd_map
+        )
+        has_ssd = any(ssd_map.values())
+        
+        if not has_ssd:
+            recommendations["upgrade_recommendations"].append(NO_SSD_RECOMMENDATION)
+        
+        recommendations["compatibility_notes"] = list(COMPATIBILITY_NOTES)
+        
+        return recommendations
     
+    @_timed("get_computer_model")
     async def get_computer_model(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get computer model and manufacturer information from the system"""
         try:
             include_details = arguments.get("include_details", True)
             
-            # Get platform-specific computer model information
-            if self.os_type == "Windows":
-                info = self._get_windows_computer_model(include_details)
-            elif self.os_type == "Darwin":
-                info = self._get_macos_computer_model(include_details)
-            else:  # Linux and other Unix-like systems
-                info = self._get_linux_computer_model(include_details)
+            # Get platform-specific computer model information; copy before
+            # adding per-call fields so the cached dict stays untouched
+            info = dict(await self._computer_model_details(include_details))
             
             # Add general system information
-            info["system_info"] = {
-                "platform": self.os_type,
-                "architecture": platform.architecture()[0],
-                "machine": platform.machine(),
-                "hostname": platform.node()
-            }
+            info["system_info"] = self._platform_summary()
             
             # Format the output
             output = "# Computer Model Information\n\n"
@@ -1266,11 +2628,9 @@ class SystemDiagnosticsServer:
             
         except Exception as e:
             logger.error(f"Error getting computer model: {e}")
-            return [types.TextContent(
-                type="text", 
-                text=f"Error retrieving computer model information: {str(e)}"
-            )]
+            return _error_result(f"Error retrieving computer model information: {str(e)}")
     
+    @_timed("get_motherboard_details")
     async def get_motherboard_details(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Get detailed motherboard information including manufacturer, model, BIOS, and hardware specifications"""
         try:
@@ -1278,20 +2638,10 @@ class SystemDiagnosticsServer:
             include_slots = arguments.get("include_slots", True)
             
             # Get platform-specific motherboard details
-            if self.os_type == "Windows":
-                info = self._get_windows_motherboard_details(include_bios, include_slots)
-            elif self.os_type == "Darwin":
-                info = self._get_macos_motherboard_details(include_bios, include_slots)
-            else:  # Linux and other Unix-like systems
-                info = self._get_linux_motherboard_details(include_bios, include_slots)
+            info = dict(await self._motherboard_details(include_bios, include_slots))
             
             # Add general system information
-            info["system_info"] = {
-                "platform": self.os_type,
-                "architecture": platform.architecture()[0],
-                "machine": platform.machine(),
-                "hostname": platform.node()
-            }
+            info["system_info"] = self._platform_summary()
             
             # Format the output
             output = "# Motherboard Details\n\n"
@@ -1354,80 +2704,128 @@ class SystemDiagnosticsServer:
             
         except Exception as e:
             logger.error(f"Error getting motherboard details: {e}")
-            return [types.TextContent(
-                type="text", 
-                text=f"Error retrieving motherboard details: {str(e)}"
-            )]
+            return _error_result(f"Error retrieving motherboard details: {str(e)}")
 
+    async def _computer_model_details(self, include_details: bool) -> Dict[str, Any]:
+        """Return the computer model information, with or without the system details
+        
+        Both views come from one cached full lookup, so switching
+        include_details between calls doesn't run the collectors again.
+        """
+        info = await self._full_computer_model()
+        if include_details:
+            return info
+        return {"basic_info": info["basic_info"], "system_details": {}}
+    
+    @_hardware_cached("computer_model")
+    async def _full_computer_model(self) -> Dict[str, Any]:
+        """Collect the platform computer model information including system details"""
+        if self.os_type == "Windows":
+            # WMI needs a COM apartment, so Windows stays on a worker thread
+            return await self._run_blocking(self._get_windows_computer_model, True)
+        elif self.os_type == "Darwin":
+            return await self._get_macos_computer_model(True)
+        else:  # Linux and other Unix-like systems
+            return await self._get_linux_computer_model(True)
+    
+    @_hardware_cached("motherboard")
+    async def _motherboard_details(self, include_bios: bool, include_slots: bool) -> Dict[str, Any]:
+        """Collect the platform motherboard details"""
+        if self.os_type == "Windows":
+            # WMI needs a COM apartment, so Windows stays on a worker thread
+            return await self._run_blocking(self._get_windows_motherboard_details, include_bios, include_slots)
+        elif self.os_type == "Darwin":
+            return await self._get_macos_motherboard_details(include_bios, include_slots)
+        else:  # Linux and other Unix-like systems
+            return await self._get_linux_motherboard_details(include_bios, include_slots)
+    
+    async def _get_motherboard_info(self) -> Dict[str, Any]:
+        """Get a short manufacturer/product summary of the motherboard"""
+        try:
+            details = await self._motherboard_details(False, False)
+            return dict(details.get("basic_info", {}))
+        except Exception as e:
+            logger.debug(f"Motherboard summary unavailable: {e}")
+            return {}
+    
     def _get_windows_motherboard_details(self, include_bios: bool, include_slots: bool) -> Dict[str, Any]:
         """Get Windows motherboard details using WMI and fallback methods"""
-        info = {
-            "basic_info": {},
-            "bios_info": {},
-            "memory_info": {},
-            "capabilities": {}
-        }
+        info = {section: {} for section in MOTHERBOARD_SECTIONS}
         
         try:
-            # Try WMI first
-            c = wmi.WMI()
+            # The registry carries the SMBIOS strings without a WMI round-trip;
+            # WMI is still read for the fields it lacks (board serial number and
+            # config options, SMBIOS version and BIOS characteristics)
+            registry = self._windows_bios_registry()
+            if registry.get("BaseBoardManufacturer") or registry.get("BaseBoardProduct"):
+                info["basic_info"]["manufacturer"] = registry.get("BaseBoardManufacturer") or 'Unknown'
+                info["basic_info"]["product"] = registry.get("BaseBoardProduct") or 'Unknown'
+                info["basic_info"]["version"] = registry.get("BaseBoardVersion") or 'Unknown'
+            if include_bios and registry.get("BIOSVendor"):
+                info["bios_info"]["manufacturer"] = registry["BIOSVendor"]
+                info["bios_info"]["version"] = registry.get("BIOSVersion") or 'Unknown'
+                info["bios_info"]["release_date"] = registry.get("BIOSReleaseDate") or 'Unknown'
             
             # Get motherboard basic info
-            for board in c.Win32_BaseBoard():
-                info["basic_info"]["manufacturer"] = getattr(board, 'Manufacturer', 'Unknown')
-                info["basic_info"]["product"] = getattr(board, 'Product', 'Unknown')
-                info["basic_info"]["version"] = getattr(board, 'Version', 'Unknown')
-                info["basic_info"]["serial_number"] = getattr(board, 'SerialNumber', 'Unknown')
+            board = next(iter(self._wmi_query("Win32_BaseBoard")), None)
+            if board is not None:
+                info["basic_info"].setdefault("manufacturer", board.get('Manufacturer', 'Unknown'))
+                info["basic_info"].setdefault("product", board.get('Product', 'Unknown'))
+                info["basic_info"].setdefault("version", board.get('Version', 'Unknown'))
+                info["basic_info"]["serial_number"] = board.get('SerialNumber', 'Unknown')
                 
                 # Additional motherboard features
-                if hasattr(board, 'ConfigOptions') and board.ConfigOptions:
-                    info["capabilities"]["config_options"] = board.ConfigOptions
-                break
+                if board.get('ConfigOptions'):
+                    info["capabilities"]["config_options"] = board['ConfigOptions']
             
             # Get BIOS info
             if include_bios:
-                for bios in c.Win32_BIOS():
-                    info["bios_info"]["manufacturer"] = getattr(bios, 'Manufacturer', 'Unknown')
-                    info["bios_info"]["version"] = getattr(bios, 'Version', 'Unknown')
-                    info["bios_info"]["release_date"] = getattr(bios, 'ReleaseDate', 'Unknown')
-                    info["bios_info"]["smbios_version"] = getattr(bios, 'SMBIOSBIOSVersion', 'Unknown')
+                bios = next(iter(self._wmi_query("Win32_BIOS")), None)
+                if bios is not None:
+                    info["bios_info"].setdefault("manufacturer", bios.get('Manufacturer', 'Unknown'))
+                    info["bios_info"].setdefault("version", bios.get('Version', 'Unknown'))
+                    info["bios_info"].setdefault("release_date", bios.get('ReleaseDate', 'Unknown'))
+                    info["bios_info"]["smbios_version"] = bios.get('SMBIOSBIOSVersion', 'Unknown')
                     
                     # BIOS characteristics
-                    if hasattr(bios, 'BiosCharacteristics'):
-                        info["bios_info"]["characteristics"] = bios.BiosCharacteristics
-                    break
-            
-            # Get memory information
-            total_memory = 0
-            memory_slots = []
-            
-            for memory in c.Win32_PhysicalMemory():
-                capacity = getattr(memory, 'Capacity', 0)
-                if capacity:
-                    capacity_gb = int(capacity) / (1024**3)
-                    total_memory += capacity_gb
-                    
-                    slot_info = {
-                        "description": getattr(memory, 'Description', 'Unknown'),
+                    if 'BiosCharacteristics' in bios:
+                        info["bios_info"]["characteristics"] = bios['BiosCharacteristics']
+            
+            # Get memory information; the per-module enumeration is only
+            # needed for the slot list
+            if include_slots:
+                # Capacity is a uint64, which WMI hands over as a string
+                modules = [
+                    (int(memory['Capacity']) / (1024**3), memory)
+                    for memory in self._wmi_query("Win32_PhysicalMemory")
+                    if memory.get('Capacity')
+                ]
+                total_memory = sum(capacity_gb for capacity_gb, _ in modules)
+                memory_slots = [
+                    {
+                        "description": memory.get('Description', 'Unknown'),
                         "size_gb": round(capacity_gb, 2),
-                        "speed_mhz": getattr(memory, 'Speed', 0),
-                        "manufacturer": getattr(memory, 'Manufacturer', 'Unknown'),
-                        "part_number": getattr(memory, 'PartNumber', 'Unknown').strip(),
-                        "form_factor": self._get_memory_form_factor(getattr(memory, 'FormFactor', 0)),
-                        "memory_type": self._get_memory_type(getattr(memory, 'MemoryType', 0))
+                        "speed_mhz": memory.get('Speed', 0),
+                        "manufacturer": memory.get('Manufacturer', 'Unknown'),
+                        "part_number": memory.get('PartNumber', 'Unknown').strip(),
+                        "form_factor": self._get_memory_form_factor(memory.get('FormFactor', 0)),
+                        "memory_type": self._get_memory_type(memory.get('MemoryType', 0))
                     }
-                    memory_slots.append(slot_info)
-            
-            if total_memory > 0:
-                info["memory_info"]["total_memory_gb"] = round(total_memory, 2)
-            if memory_slots:
-                info["memory_info"]["slots"] = memory_slots
+                    for capacity_gb, memory in modules
+                ]
+                
+                if total_memory > 0:
+                    info["memory_info"]["total_memory_gb"] = round(total_memory, 2)
+                if memory_slots:
+                    info["memory_info"]["slots"] = memory_slots
+            else:
+                info["memory_info"]["total_memory_gb"] = round(psutil.virtual_memory().total / (1024**3), 2)
             
             # Get processor info for socket type
-            for processor in c.Win32_Processor():
-                info["capabilities"]["cpu_socket"] = getattr(processor, 'SocketDesignation', 'Unknown')
-                info["capabilities"]["cpu_manufacturer"] = getattr(processor, 'Manufacturer', 'Unknown')
-                break
+            processor = next(iter(self._wmi_query("Win32_Processor")), None)
+            if processor is not None:
+                info["capabilities"]["cpu_socket"] = processor.get('SocketDesignation', 'Unknown')
+                info["capabilities"]["cpu_manufacturer"] = processor.get('Manufacturer', 'Unknown')
                 
         except Exception as e:
             logger.warning(f"WMI failed, trying subprocess method: {e}")
@@ -1438,218 +2836,290 @@ class SystemDiagnosticsServer:
     
     def _get_windows_motherboard_via_subprocess(self, include_bios: bool, include_slots: bool) -> Dict[str, Any]:
         """Get Windows motherboard details using subprocess and registry"""
-        info = {
-            "basic_info": {},
-            "bios_info": {},
-            "memory_info": {},
-            "capabilities": {}
-        }
+        info = {section: {} for section in MOTHERBOARD_SECTIONS}
         
         try:
-            # Get motherboard info using wmic
-            result = subprocess.run(
-                ["wmic", "baseboard", "get", "Manufacturer,Product,Version,SerialNumber", "/format:csv"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # The wmic queries are independent; run them side by side
+            commands = {
+                "baseboard": ["wmic", "baseboard", "get", "Manufacturer,Product,Version,SerialNumber", "/format:csv"]
+            }
+            if include_slots:
+                commands["memorychip"] = ["wmic", "memorychip", "get", MEMORYCHIP_FIELDS, "/format:csv"]
+            if include_bios:
+                commands["bios"] = ["wmic", "bios", "get", "Manufacturer,Version,ReleaseDate,SMBIOSBIOSVersion", "/format:csv"]
+            results = self._run_commands(commands)
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line and not line.startswith('Node'):
-                        parts = line.split(',')
-                        if len(parts) >= 5:
-                            info["basic_info"]["manufacturer"] = parts[1].strip() or 'Unknown'
-                            info["basic_info"]["product"] = parts[2].strip() or 'Unknown'
-                            info["basic_info"]["serial_number"] = parts[3].strip() or 'Unknown'
-                            info["basic_info"]["version"] = parts[4].strip() or 'Unknown'
-                            break
+            # Get motherboard info using wmic
+            result = results["baseboard"]
+            row = self._first_wmic_row(result)
+            if row:
+                info["basic_info"]["manufacturer"] = self._wmic_field(row, "Manufacturer")
+                info["basic_info"]["product"] = self._wmic_field(row, "Product")
+                info["basic_info"]["serial_number"] = self._wmic_field(row, "SerialNumber")
+                info["basic_info"]["version"] = self._wmic_field(row, "Version")
             
             # Get BIOS info
             if include_bios:
-                result = subprocess.run(
-                    ["wmic", "bios", "get", "Manufacturer,Version,ReleaseDate,SMBIOSBIOSVersion", "/format:csv"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if line and not line.startswith('Node'):
-                            parts = line.split(',')
-                            if len(parts) >= 5:
-                                info["bios_info"]["manufacturer"] = parts[1].strip() or 'Unknown'
-                                info["bios_info"]["release_date"] = parts[2].strip() or 'Unknown'
-                                info["bios_info"]["smbios_version"] = parts[3].strip() or 'Unknown'
-                                info["bios_info"]["version"] = parts[4].strip() or 'Unknown'
-                                break
+                row = self._first_wmic_row(results["bios"])
+                if row:
+                    info["bios_info"]["manufacturer"] = self._wmic_field(row, "Manufacturer")
+                    info["bios_info"]["release_date"] = self._wmic_field(row, "ReleaseDate")
+                    info["bios_info"]["smbios_version"] = self._wmic_field(row, "SMBIOSBIOSVersion")
+                    info["bios_info"]["version"] = self._wmic_field(row, "Version")
             
             # Get memory info
-            result = subprocess.run(
-                ["wmic", "memorychip", "get", "Capacity,Speed,Manufacturer,PartNumber,FormFactor,MemoryType", "/format:csv"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                total_memory = 0
-                memory_slots = []
-                
-                for line in lines:
-                    if line and not line.startswith('Node') and ',' in line:
-                        parts = line.split(',')
-                        if len(parts) >= 7:
-                            try:
-                                capacity = int(parts[1]) if parts[1].strip() else 0
-                                if capacity > 0:
-                                    capacity_gb = capacity / (1024**3)
-                                    total_memory += capacity_gb
-                                    
-                                    form_factor = int(parts[2]) if parts[2].strip().isdigit() else 0
-                                    memory_type = int(parts[6]) if parts[6].strip().isdigit() else 0
-                                    
-                                    slot_info = {
-                                        "description": "Memory Module",
-                                        "size_gb": round(capacity_gb, 2),
-                                        "speed_mhz": int(parts[5]) if parts[5].strip().isdigit() else 0,
-                                        "manufacturer": parts[3].strip() or 'Unknown',
-                                        "part_number": parts[4].strip() or 'Unknown',
-                                        "form_factor": self._get_memory_form_factor(form_factor),
-                                        "memory_type": self._get_memory_type(memory_type)
-                                    }
-                                    memory_slots.append(slot_info)
-                            except (ValueError, IndexError):
-                                continue
-                
+            if include_slots:
+                total_memory, memory_slots = self._memory_slots_from_rows(self._wmic_rows(results["memorychip"]))
                 if total_memory > 0:
                     info["memory_info"]["total_memory_gb"] = round(total_memory, 2)
                 if memory_slots:
                     info["memory_info"]["slots"] = memory_slots
+            else:
+                info["memory_info"]["total_memory_gb"] = round(psutil.virtual_memory().total / (1024**3), 2)
             
             # Try to get additional info from registry
-            try:
-                import winreg
-                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\BIOS")
-                try:
-                    bios_vendor, _ = winreg.QueryValueEx(key, "BIOSVendor")
-                    if bios_vendor and not info["bios_info"].get("manufacturer"):
-                        info["bios_info"]["manufacturer"] = bios_vendor
-                except FileNotFoundError:
-                    pass
-                
-                try:
-                    bios_version, _ = winreg.QueryValueEx(key, "BIOSVersion")
-                    if bios_version and not info["bios_info"].get("version"):
-                        info["bios_info"]["version"] = bios_version
-                except FileNotFoundError:
-                    pass
-                
-                winreg.CloseKey(key)
-            except Exception:
-                pass
+            registry = self._windows_bios_registry()
+            if registry.get("BIOSVendor") and not info["bios_info"].get("manufacturer"):
+                info["bios_info"]["manufacturer"] = registry["BIOSVendor"]
+            if registry.get("BIOSVersion") and not info["bios_info"].get("version"):
+                info["bios_info"]["version"] = registry["BIOSVersion"]
                 
         except Exception as e:
             logger.error(f"Error in subprocess motherboard detection: {e}")
         
         return info
     
-    def _get_memory_form_factor(self, form_factor: int) -> str:
+    def _windows_bios_registry(self) -> Dict[str, Any]:
+        """The SMBIOS registry strings, read once; firmware doesn't change while we run"""
+        return self._cached("bios_registry", None, self._read_windows_bios_registry)
+    
+    @staticmethod
+    def _read_windows_bios_registry() -> Dict[str, Any]:
+        """Read the SMBIOS strings under HKLM\\HARDWARE\\DESCRIPTION\\System\\BIOS in one pass"""
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, BIOS_REGISTRY_KEY) as key:
+                values = {}
+                for i in range(winreg.QueryInfoKey(key)[1]):
+                    name, value, _ = winreg.EnumValue(key, i)
+                    values[name] = value
+                return values
+        except (ImportError, OSError):
+            return {}
+    
+    @staticmethod
+    def _wmic_rows(result: Optional[subprocess.CompletedProcess]) -> Iterator[Dict[str, str]]:
+        """Parse the output of a wmic /format:csv run lazily into one dict per row
+        
+        Columns are read by their header names; wmic orders them
+        alphabetically regardless of the order they were requested in.
+        """
+        if result is None or result.returncode != 0:
+            return iter(())
+        # wmic pads its output with blank lines and \r\r\n endings
+        lines = filter(None, map(str.strip, result.stdout.splitlines()))
+        return csv.DictReader(lines)
+    
+    @classmethod
+    def _first_wmic_row(cls, result: Optional[subprocess.CompletedProcess]) -> Dict[str, str]:
+        """The first row with any field besides Node set, or {} when there is none"""
+        return next(
+            (row for row in cls._wmic_rows(result)
+             if any(value for name, value in row.items() if name != "Node")),
+            {}
+        )
+    
+    @staticmethod
+    def _wmic_field(row: Dict[str, str], name: str) -> str:
+        """A stripped wmic CSV field, or 'Unknown' when it is empty"""
+        return (row.get(name) or "").strip() or 'Unknown'
+    
+    @staticmethod
+    def _run_commands(commands: Dict[str, List[str]], timeout: float = 30,
+                      text: bool = True) -> Dict[str, Optional[subprocess.CompletedProcess]]:
+        """Run independent commands concurrently and return their results by name
+        
+        Total latency is that of the slowest command rather than the sum.
+        Commands that are missing or time out map to None. With text=False
+        the output is left as bytes (e.g. for plistlib).
+        """
+        def run(cmd):
+            try:
+                return subprocess.run(cmd, capture_output=True, text=text, timeout=timeout)
+            except (OSError, subprocess.SubprocessError):
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(commands))) as pool:
+            futures = {name: pool.submit(run, cmd) for name, cmd in commands.items()}
+        return {name: future.result() for name, future in futures.items()}
+    
+    @staticmethod
+    async def _run_commands_async(commands: Dict[str, List[str]], timeout: float = 30,
+                                  text: bool = True) -> Dict[str, Optional[subprocess.CompletedProcess]]:
+        """Like _run_commands, but with asyncio subprocesses awaited on the event loop
+        
+        No executor thread is held while the commands run.
+        """
+        async def run(cmd):
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+            except OSError:
+                return None
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return None
+            if text:
+                stdout = stdout.decode(errors="replace")
+                stderr = stderr.decode(errors="replace")
+            return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+        
+        outputs = await asyncio.gather(*(run(cmd) for cmd in commands.values()))
+        return dict(zip(commands, outputs))
+    
+    def _memory_slots_from_rows(self, rows: Iterator[Dict[str, str]]) -> Tuple[float, List[Dict[str, Any]]]:
+        """Build memory slot entries from wmic memorychip rows"""
+        total_memory = 0
+        memory_slots = []
+        
+        for row in rows:
+            try:
+                capacity = int(row.get("Capacity") or 0)
+            except ValueError:
+                continue
+            if capacity <= 0:
+                continue
+            
+            capacity_gb = capacity / (1024**3)
+            total_memory += capacity_gb
+            
+            speed = (row.get("Speed") or "").strip()
+            form_factor = (row.get("FormFactor") or "").strip()
+            memory_type = (row.get("MemoryType") or "").strip()
+            memory_slots.append({
+                "description": "Memory Module",
+                "size_gb": round(capacity_gb, 2),
+                "speed_mhz": int(speed) if speed.isdigit() else 0,
+                "manufacturer": (row.get("Manufacturer") or "").strip() or 'Unknown',
+                "part_number": (row.get("PartNumber") or "").strip() or 'Unknown',
+                "form_factor": self._get_memory_form_factor(int(form_factor) if form_factor.isdigit() else 0),
+                "memory_type": self._get_memory_type(int(memory_type) if memory_type.isdigit() else 0)
+            })
+        
+        return total_memory, memory_slots
+    
+    @staticmethod
+    def _get_memory_form_factor(form_factor: int) -> str:
         """Convert memory form factor code to readable string"""
-        form_factors = {
-            0: "Unknown",
-            1: "Other",
-            2: "SIP",
-            3: "DIP", 
-            4: "ZIP",
-            5: "SOJ",
-            6: "Proprietary",
-            7: "SIMM",
-            8: "DIMM",
-            9: "TSOP",
-            10: "PGA",
-            11: "RIMM",
-            12: "SODIMM",
-            13: "SRIMM",
-            14: "SMD",
-            15: "SSMP",
-            16: "QFP",
-            17: "TQFP",
-            18: "SOIC",
-            19: "LCC",
-            20: "PLCC",
-            21: "BGA",
-            22: "FPBGA",
-            23: "LGA"
-        }
-        return form_factors.get(form_factor, f"Unknown ({form_factor})")
+        return MEMORY_FORM_FACTORS.get(form_factor, f"Unknown ({form_factor})")
     
-    def _get_memory_type(self, memory_type: int) -> str:
+    @staticmethod
+    def _get_memory_type(memory_type: int) -> str:
         """Convert memory type code to readable string"""
-        memory_types = {
-            0: "Unknown",
-            1: "Other",
-            2: "DRAM",
-            3: "Synchronous DRAM",
-            4: "Cache DRAM",
-            5: "EDO",
-            6: "EDRAM",
-            7: "VRAM",
-            8: "SRAM",
-            9: "RAM",
-            10: "ROM",
-            11: "Flash",
-            12: "EEPROM",
-            13: "FEPROM",
-            14: "EPROM",
-            15: "CDRAM",
-            16: "3DRAM",
-            17: "SDRAM",
-            18: "SGRAM",
-            19: "RDRAM",
-            20: "DDR",
-            21: "DDR2",
-            22: "DDR2 FB-DIMM",
-            24: "DDR3",
-            25: "FBD2",
-            26: "DDR4",
-            27: "LPDDR",
-            28: "LPDDR2",
-            29: "LPDDR3",
-            30: "LPDDR4"
-        }
-        return memory_types.get(memory_type, f"Unknown ({memory_type})")
+        return MEMORY_TYPES.get(memory_type, f"Unknown ({memory_type})")
+    
+    @staticmethod
+    def _read_dmi_id(files: Dict[str, str]) -> Dict[str, str]:
+        """Read DMI_ID_DIR files by key, leaving out missing, unreadable and empty ones"""
+        values = {}
+        for key, name in files.items():
+            # Missing and root-only files both raise OSError
+            try:
+                value = _read_small_file(os.path.join(DMI_ID_DIR, name), DMI_ID_READ_SIZE).strip()
+            except OSError:
+                continue
+            if value and value != "Not Specified":
+                values[key] = value
+        return values
+    
+    @staticmethod
+    def _read_smbios_memory_devices() -> List[Dict[str, Any]]:
+        """Build memory slot entries from the SMBIOS type 17 records in /sys
+        
+        Empty slots are skipped. Returns [] when the records are missing or
+        unreadable (they need root).
+        """
+        try:
+            names = [entry.name for entry in os.scandir(SMBIOS_ENTRIES_DIR) if entry.name.startswith("17-")]
+        except OSError:
+            return []
+        
+        memory_slots = []
+        for name in sorted(names, key=lambda n: int(n.partition("-")[2])):
+            try:
+                with open(os.path.join(SMBIOS_ENTRIES_DIR, name, "raw"), "rb") as f:
+                    raw = f.read()
+            except OSError:
+                continue
+            
+            # Formatted section (its length is byte 1), then the string set;
+            # string fields hold 1-based indexes into it
+            length = raw[1] if len(raw) > 1 else 0
+            if length < 0x15:
+                continue
+            strings = raw[length:].split(b"\0")
+            
+            def string(offset):
+                index = raw[offset] if offset < length else 0
+                if 0 < index <= len(strings):
+                    return strings[index - 1].decode("ascii", "replace").strip()
+                return ""
+            
+            # Size: 0 means no module; bit 15 selects KB over MB; 0x7FFF
+            # defers to the 32-bit extended size in MB
+            size = struct.unpack_from("<H", raw, 0x0C)[0]
+            if size in (0, 0xFFFF):
+                continue
+            if size == 0x7FFF and length >= 0x20:
+                size_mb = struct.unpack_from("<I", raw, 0x1C)[0] & 0x7FFFFFFF
+            elif size & 0x8000:
+                size_mb = (size & 0x7FFF) / 1024
+            else:
+                size_mb = size
+            
+            speed = struct.unpack_from("<H", raw, 0x15)[0] if length >= 0x17 else 0
+            memory_slots.append({
+                "description": string(0x10) or "Unknown",
+                "size_gb": round(size_mb / 1024, 2),
+                "speed_mhz": speed,
+                "manufacturer": string(0x17) or "Unknown",
+                "part_number": string(0x1A) or "Unknown",
+                "form_factor": SMBIOS_FORM_FACTORS.get(raw[0x0E], f"Unknown ({raw[0x0E]})"),
+                "memory_type": SMBIOS_MEMORY_TYPES.get(raw[0x12], f"Unknown ({raw[0x12]})")
+            })
+        return memory_slots
     
-    def _get_macos_motherboard_details(self, include_bios: bool, include_slots: bool) -> Dict[str, Any]:
+    async def _get_macos_motherboard_details(self, include_bios: bool, include_slots: bool) -> Dict[str, Any]:
         """Get macOS motherboard details using system_profiler"""
-        info = {
-            "basic_info": {},
-            "bios_info": {},
-            "memory_info": {},
-            "capabilities": {}
-        }
+        info = {section: {} for section in MOTHERBOARD_SECTIONS}
         
         try:
-            # Get hardware overview
-            result = subprocess.run(
-                ["system_profiler", "SPHardwareDataType", "-xml"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # Each system_profiler data type takes a second or more; run
+            # the independent queries side by side
+            commands = {
+                "hardware": ["system_profiler", "SPHardwareDataType", "-xml"]
+            }
+            if include_slots:
+                commands["memory"] = ["system_profiler", "SPMemoryDataType", "-xml"]
+            # Raw bytes go straight to plistlib without a decode/encode
+            # round-trip; -xml output is parsed as XML without format sniffing
+            results = await self._run_commands_async(commands, text=False)
             
-            if result.returncode == 0:
+            # Get hardware overview
+            result = results["hardware"]
+            if result is not None and result.returncode == 0:
                 try:
                     import plistlib
-                    data = plistlib.loads(result.stdout.encode())
+                    data = plistlib.loads(result.stdout, fmt=plistlib.FMT_XML)
                     
                     if data and len(data) > 0:
-                        hardware_items = data[0].get('_items', [])
-                        for item in hardware_items:
+                        # SPHardwareDataType reports a single hardware item
+                        item = next(iter(data[0].get('_items', [])), None)
+                        if item is not None:
                             # Basic motherboard info (from Apple's perspective)
                             info["basic_info"]["manufacturer"] = "Apple Inc."
                             info["basic_info"]["product"] = item.get("machine_model", "Unknown")
@@ -1664,7 +3134,7 @@ class SystemDiagnosticsServer:
                                     if "GB" in memory_str:
                                         memory_gb = float(memory_str.split()[0])
                                         info["memory_info"]["total_memory_gb"] = memory_gb
-                                except:
+                                except ValueError:
                                     pass
                             
                             # CPU information
@@ -1675,23 +3145,16 @@ class SystemDiagnosticsServer:
                             if include_bios:
                                 info["bios_info"]["boot_rom_version"] = item.get("boot_rom_version", "Unknown")
                                 info["bios_info"]["smc_version"] = item.get("SMC_version", "Unknown")
-                            
-                            break
                 except Exception as e:
                     logger.warning(f"Failed to parse system_profiler XML: {e}")
             
             # Get memory details if requested
             if include_slots:
-                result = subprocess.run(
-                    ["system_profiler", "SPMemoryDataType", "-xml"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
+                result = results["memory"]
+                if result is not None and result.returncode == 0:
                     try:
-                        memory_data = plistlib.loads(result.stdout.encode())
+                        import plistlib
+                        memory_data = plistlib.loads(result.stdout, fmt=plistlib.FMT_XML)
                         if memory_data and len(memory_data) > 0:
                             memory_items = memory_data[0].get('_items', [])
                             memory_slots = []
@@ -1718,7 +3181,7 @@ class SystemDiagnosticsServer:
                                                     "status": bank.get('dimm_status', 'Unknown')
                                                 }
                                                 memory_slots.append(slot_info)
-                                            except:
+                                            except (ValueError, IndexError):
                                                 pass
                             
                             if memory_slots:
@@ -1726,117 +3189,87 @@ class SystemDiagnosticsServer:
                     except Exception as e:
                         logger.warning(f"Failed to parse memory data: {e}")
             
-            # Get additional system information
-            result = subprocess.run(
-                ["system_profiler", "SPSoftwareDataType"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    line = line.strip()
-                    if 'System Version:' in line:
-                        info["capabilities"]["system_version"] = line.split(':', 1)[1].strip()
-                    elif 'Kernel Version:' in line:
-                        info["capabilities"]["kernel_version"] = line.split(':', 1)[1].strip()
+            # OS and kernel versions, formatted as system_profiler's
+            # SPSoftwareDataType reports them, without spawning it
+            system_version = self._macos_system_version()
+            if system_version:
+                info["capabilities"]["system_version"] = system_version
+            info["capabilities"]["kernel_version"] = f"Darwin {os.uname().release}"
         
         except Exception as e:
             logger.error(f"Error getting macOS motherboard details: {e}")
         
         return info
     
-    def _get_linux_motherboard_details(self, include_bios: bool, include_slots: bool) -> Dict[str, Any]:
+    @staticmethod
+    def _macos_system_version() -> Optional[str]:
+        """macOS name, version and build, e.g. 'macOS 14.2 (23C64)'"""
+        try:
+            with open(MACOS_VERSION_PLIST, 'rb') as f:
+                version = _load_plist(f.read())
+        except Exception:
+            return None
+        return f"{version.get('ProductName', 'macOS')} {version.get('ProductVersion', '')} ({version.get('ProductBuildVersion', '')})"
+    
+    async def _get_linux_motherboard_details(self, include_bios: bool, include_slots: bool) -> Dict[str, Any]:
         """Get Linux motherboard details"""
-        info = {
-            "basic_info": {},
-            "bios_info": {},
-            "memory_info": {},
-            "capabilities": {}
-        }
+        info = {section: {} for section in MOTHERBOARD_SECTIONS}
         
         try:
-            # Try dmidecode first (requires sudo)
-            result = subprocess.run(
-                ["sudo", "-n", "dmidecode", "-t", "baseboard"],
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    line = line.strip()
-                    if 'Manufacturer:' in line:
-                        info["basic_info"]["manufacturer"] = line.split(':', 1)[1].strip()
-                    elif 'Product Name:' in line:
-                        info["basic_info"]["product"] = line.split(':', 1)[1].strip()
-                    elif 'Version:' in line:
-                        info["basic_info"]["version"] = line.split(':', 1)[1].strip()
-                    elif 'Serial Number:' in line:
-                        info["basic_info"]["serial_number"] = line.split(':', 1)[1].strip()
+            # The kernel exports the DMI strings under /sys; reading them needs
+            # no process and (except for serial numbers) no privileges
+            info["basic_info"].update(self._read_dmi_id(DMI_ID_BOARD_FILES))
+            if include_bios:
+                info["bios_info"].update(self._read_dmi_id(DMI_ID_BIOS_FILES))
+            
+            # The SMBIOS memory device records give the slots without a
+            # process; they need root, so lshw remains the fallback
+            memory_slots = self._read_smbios_memory_devices() if include_slots else []
+            
+            # Fall back to dmidecode (requires root or sudo) only for what
+            # /sys couldn't provide, running it alongside lshw
+            need_board = not info["basic_info"]
+            need_bios = include_bios and not info["bios_info"]
+            commands = {}
+            if include_slots and not memory_slots:
+                commands["lshw"] = ["lshw", "-C", "memory", "-json"]
+            dmidecode = await self._run_blocking(self._dmidecode_command) if need_board or need_bios else None
+            if dmidecode is not None:
+                if need_board:
+                    commands["baseboard"] = dmidecode + ["-t", "baseboard"]
+                if need_bios:
+                    commands["bios"] = dmidecode + ["-t", "bios"]
+            results = await self._run_commands_async(commands)
+            
+            result = results.get("baseboard")
+            if result is not None and result.returncode == 0:
+                info["basic_info"].update(_pick_fields(_text_fields(result.stdout, DMI_BOARD_KEYS), DMI_BOARD_KEYS))
             
             # Get BIOS info
-            if include_bios:
-                result = subprocess.run(
-                    ["sudo", "-n", "dmidecode", "-t", "bios"],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        line = line.strip()
-                        if 'Vendor:' in line:
-                            info["bios_info"]["vendor"] = line.split(':', 1)[1].strip()
-                        elif 'Version:' in line:
-                            info["bios_info"]["version"] = line.split(':', 1)[1].strip()
-                        elif 'Release Date:' in line:
-                            info["bios_info"]["release_date"] = line.split(':', 1)[1].strip()
-            
-            # Fallback to /sys/devices if dmidecode fails
-            if not info["basic_info"]:
-                sys_paths = {
-                    "manufacturer": "/sys/devices/virtual/dmi/id/board_vendor",
-                    "product": "/sys/devices/virtual/dmi/id/board_name",
-                    "version": "/sys/devices/virtual/dmi/id/board_version",
-                    "serial_number": "/sys/devices/virtual/dmi/id/board_serial",
-                    "bios_vendor": "/sys/devices/virtual/dmi/id/bios_vendor",
-                    "bios_version": "/sys/devices/virtual/dmi/id/bios_version",
-                    "bios_date": "/sys/devices/virtual/dmi/id/bios_date"
-                }
-                
-                for key, path in sys_paths.items():
-                    if os.path.exists(path):
-                        try:
-                            with open(path, 'r') as f:
-                                value = f.read().strip()
-                                if key.startswith('bios_'):
-                                    info["bios_info"][key.replace('bios_', '')] = value
-                                else:
-                                    info["basic_info"][key] = value
-                        except:
-                            pass
+            result = results.get("bios")
+            if result is not None and result.returncode == 0:
+                info["bios_info"].update(_pick_fields(_text_fields(result.stdout, DMI_BIOS_KEYS), DMI_BIOS_KEYS))
             
             # Get memory information from /proc/meminfo
-            if os.path.exists('/proc/meminfo'):
+            try:
                 with open('/proc/meminfo', 'r') as f:
                     for line in f:
-                        if 'MemTotal' in line:
-                            mem_kb = int(line.split()[1])
+                        label, _, value = line.partition(':')
+                        if label == 'MemTotal':
+                            mem_kb = int(value.split()[0])
                             info["memory_info"]["total_memory_gb"] = round(mem_kb / (1024**2), 2)
                             break
+            except OSError:
+                pass
             
-            # Try lshw for additional details
-            result = subprocess.run(
-                ["lshw", "-C", "memory", "-json"],
-                capture_output=True,
-                text=True
-            )
+            if memory_slots:
+                info["memory_info"]["slots"] = memory_slots
             
-            if result.returncode == 0:
+            # Try lshw for additional details
+            result = results.get("lshw")
+            if result is not None and result.returncode == 0:
                 try:
-                    memory_data = json.loads(result.stdout)
+                    memory_data = loads(result.stdout)
                     # Parse lshw output for memory slots
                     if isinstance(memory_data, list):
                         memory_slots = []
@@ -1851,7 +3284,8 @@ class SystemDiagnosticsServer:
                         
                         if memory_slots:
                             info["memory_info"]["slots"] = memory_slots
-                except:
+                except (ValueError, AttributeError, TypeError):
+                    # Unparseable JSON or an unexpected lshw layout
                     pass
             
         except Exception as e:
@@ -1861,44 +3295,46 @@ class SystemDiagnosticsServer:
     
     def _get_windows_computer_model(self, include_details: bool) -> Dict[str, Any]:
         """Get Windows computer model and manufacturer using WMI and fallback methods"""
-        info = {
-            "basic_info": {},
-            "system_details": {}
-        }
+        info = {section: {} for section in COMPUTER_MODEL_SECTIONS}
         
         try:
-            # Try WMI first
-            c = wmi.WMI()
-            
-            # Get computer system information
-            for system in c.Win32_ComputerSystem():
-                info["basic_info"]["manufacturer"] = getattr(system, 'Manufacturer', 'Unknown')
-                info["basic_info"]["model"] = getattr(system, 'Model', 'Unknown')
-                info["basic_info"]["name"] = getattr(system, 'Name', 'Unknown')
+            # Try WMI first; the enclosure and product classes are only
+            # needed for details, and are then read alongside the system
+            if include_details:
+                systems, enclosures, products = self._wmi_queries(
+                    "Win32_ComputerSystem", "Win32_SystemEnclosure", "Win32_ComputerSystemProduct"
+                )
+            else:
+                systems, enclosures, products = self._wmi_query("Win32_ComputerSystem"), [], []
+            
+            system = next(iter(systems), None)
+            if system is not None:
+                info["basic_info"]["manufacturer"] = system.get('Manufacturer', 'Unknown')
+                info["basic_info"]["model"] = system.get('Model', 'Unknown')
+                info["basic_info"]["name"] = system.get('Name', 'Unknown')
                 
                 if include_details:
-                    info["system_details"]["domain"] = getattr(system, 'Domain', 'Unknown')
-                    info["system_details"]["workgroup"] = getattr(system, 'Workgroup', 'Unknown')
-                    info["system_details"]["total_physical_memory"] = getattr(system, 'TotalPhysicalMemory', 'Unknown')
-                    info["system_details"]["system_type"] = getattr(system, 'SystemType', 'Unknown')
-                    info["system_details"]["pc_system_type"] = getattr(system, 'PCSystemType', 'Unknown')
-                break
+                    info["system_details"]["domain"] = system.get('Domain', 'Unknown')
+                    info["system_details"]["workgroup"] = system.get('Workgroup', 'Unknown')
+                    info["system_details"]["total_physical_memory"] = system.get('TotalPhysicalMemory', 'Unknown')
+                    info["system_details"]["system_type"] = system.get('SystemType', 'Unknown')
+                    info["system_details"]["pc_system_type"] = system.get('PCSystemType', 'Unknown')
             
             # Get additional system enclosure information
             if include_details:
-                for enclosure in c.Win32_SystemEnclosure():
-                    info["system_details"]["chassis_types"] = getattr(enclosure, 'ChassisTypes', 'Unknown')
-                    info["system_details"]["serial_number"] = getattr(enclosure, 'SerialNumber', 'Unknown')
-                    info["system_details"]["smbios_asset_tag"] = getattr(enclosure, 'SMBIOSAssetTag', 'Unknown')
-                    break
+                enclosure = next(iter(enclosures), None)
+                if enclosure is not None:
+                    info["system_details"]["chassis_types"] = enclosure.get('ChassisTypes', 'Unknown')
+                    info["system_details"]["serial_number"] = enclosure.get('SerialNumber', 'Unknown')
+                    info["system_details"]["smbios_asset_tag"] = enclosure.get('SMBIOSAssetTag', 'Unknown')
                 
                 # Get computer system product information
-                for product in c.Win32_ComputerSystemProduct():
-                    info["system_details"]["uuid"] = getattr(product, 'UUID', 'Unknown')
-                    info["system_details"]["identifying_number"] = getattr(product, 'IdentifyingNumber', 'Unknown')
-                    info["system_details"]["sku_number"] = getattr(product, 'SKUNumber', 'Unknown')
-                    info["system_details"]["version"] = getattr(product, 'Version', 'Unknown')
-                    break
+                product = next(iter(products), None)
+                if product is not None:
+                    info["system_details"]["uuid"] = product.get('UUID', 'Unknown')
+                    info["system_details"]["identifying_number"] = product.get('IdentifyingNumber', 'Unknown')
+                    info["system_details"]["sku_number"] = product.get('SKUNumber', 'Unknown')
+                    info["system_details"]["version"] = product.get('Version', 'Unknown')
                 
         except Exception as e:
             logger.warning(f"WMI failed, trying wmic fallback: {e}")
@@ -1909,107 +3345,75 @@ class SystemDiagnosticsServer:
     
     def _get_windows_computer_model_via_wmic(self, include_details: bool) -> Dict[str, Any]:
         """Get Windows computer model using wmic command as fallback"""
-        info = {
-            "basic_info": {},
-            "system_details": {}
-        }
+        info = {section: {} for section in COMPUTER_MODEL_SECTIONS}
         
         try:
-            # Get basic computer system info
-            result = subprocess.run(
-                ["wmic", "computersystem", "get", "Manufacturer,Model,Name,Domain,Workgroup,TotalPhysicalMemory,SystemType", "/format:csv"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # The wmic queries are independent; run them side by side
+            commands = {
+                "computersystem": ["wmic", "computersystem", "get", "Manufacturer,Model,Name,Domain,Workgroup,TotalPhysicalMemory,SystemType", "/format:csv"]
+            }
+            if include_details:
+                commands["systemenclosure"] = ["wmic", "systemenclosure", "get", "ChassisTypes,SerialNumber,SMBIOSAssetTag", "/format:csv"]
+                commands["computersystemproduct"] = ["wmic", "computersystemproduct", "get", "UUID,IdentifyingNumber,SKUNumber,Version", "/format:csv"]
+            results = self._run_commands(commands)
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line and not line.startswith('Node'):
-                        parts = line.split(',')
-                        if len(parts) >= 8:
-                            info["basic_info"]["manufacturer"] = parts[2].strip() or 'Unknown'
-                            info["basic_info"]["model"] = parts[3].strip() or 'Unknown'
-                            info["basic_info"]["name"] = parts[4].strip() or 'Unknown'
-                            
-                            if include_details:
-                                info["system_details"]["domain"] = parts[1].strip() or 'Unknown'
-                                info["system_details"]["workgroup"] = parts[8].strip() or 'Unknown'
-                                info["system_details"]["total_physical_memory"] = parts[7].strip() or 'Unknown'
-                                info["system_details"]["system_type"] = parts[6].strip() or 'Unknown'
-                            break
+            # Get basic computer system info
+            row = self._first_wmic_row(results["computersystem"])
+            if row:
+                info["basic_info"]["manufacturer"] = self._wmic_field(row, "Manufacturer")
+                info["basic_info"]["model"] = self._wmic_field(row, "Model")
+                info["basic_info"]["name"] = self._wmic_field(row, "Name")
+                
+                if include_details:
+                    info["system_details"]["domain"] = self._wmic_field(row, "Domain")
+                    info["system_details"]["workgroup"] = self._wmic_field(row, "Workgroup")
+                    info["system_details"]["total_physical_memory"] = self._wmic_field(row, "TotalPhysicalMemory")
+                    info["system_details"]["system_type"] = self._wmic_field(row, "SystemType")
             
             # Get additional details if requested
             if include_details:
                 # Get system enclosure info
-                result = subprocess.run(
-                    ["wmic", "systemenclosure", "get", "ChassisTypes,SerialNumber,SMBIOSAssetTag", "/format:csv"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if line and not line.startswith('Node'):
-                            parts = line.split(',')
-                            if len(parts) >= 4:
-                                info["system_details"]["chassis_types"] = parts[1].strip() or 'Unknown'
-                                info["system_details"]["serial_number"] = parts[2].strip() or 'Unknown'
-                                info["system_details"]["smbios_asset_tag"] = parts[3].strip() or 'Unknown'
-                                break
+                row = self._first_wmic_row(results["systemenclosure"])
+                if row:
+                    info["system_details"]["chassis_types"] = self._wmic_field(row, "ChassisTypes")
+                    info["system_details"]["serial_number"] = self._wmic_field(row, "SerialNumber")
+                    info["system_details"]["smbios_asset_tag"] = self._wmic_field(row, "SMBIOSAssetTag")
                 
                 # Get computer system product info
-                result = subprocess.run(
-                    ["wmic", "computersystemproduct", "get", "UUID,IdentifyingNumber,SKUNumber,Version", "/format:csv"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if line and not line.startswith('Node'):
-                            parts = line.split(',')
-                            if len(parts) >= 5:
-                                info["system_details"]["uuid"] = parts[4].strip() or 'Unknown'
-                                info["system_details"]["identifying_number"] = parts[1].strip() or 'Unknown'
-                                info["system_details"]["sku_number"] = parts[2].strip() or 'Unknown'
-                                info["system_details"]["version"] = parts[3].strip() or 'Unknown'
-                                break
+                row = self._first_wmic_row(results["computersystemproduct"])
+                if row:
+                    info["system_details"]["uuid"] = self._wmic_field(row, "UUID")
+                    info["system_details"]["identifying_number"] = self._wmic_field(row, "IdentifyingNumber")
+                    info["system_details"]["sku_number"] = self._wmic_field(row, "SKUNumber")
+                    info["system_details"]["version"] = self._wmic_field(row, "Version")
             
         except Exception as e:
             logger.error(f"Error in wmic computer model detection: {e}")
         
         return info
     
-    def _get_macos_computer_model(self, include_details: bool) -> Dict[str, Any]:
+    async def _get_macos_computer_model(self, include_details: bool) -> Dict[str, Any]:
         """Get macOS computer model using system_profiler"""
-        info = {
-            "basic_info": {},
-            "system_details": {}
-        }
+        info = {section: {} for section in COMPUTER_MODEL_SECTIONS}
         
         try:
             # Get hardware overview
-            result = subprocess.run(
-                ["system_profiler", "SPHardwareDataType", "-xml"],
-                capture_output=True,
-                text=True,
-                timeout=30
+            results = await self._run_commands_async(
+                {"hardware": ["system_profiler", "SPHardwareDataType", "-xml"]}, text=False
             )
+            result = results["hardware"]
             
-            if result.returncode == 0:
+            xml_parsed = False
+            if result is not None and result.returncode == 0:
                 try:
                     import plistlib
-                    data = plistlib.loads(result.stdout.encode())
+                    data = plistlib.loads(result.stdout, fmt=plistlib.FMT_XML)
+                    xml_parsed = True
                     
                     if data and len(data) > 0:
-                        hardware_items = data[0].get('_items', [])
-                        for item in hardware_items:
+                        # SPHardwareDataType reports a single hardware item
+                        item = next(iter(data[0].get('_items', [])), None)
+                        if item is not None:
                             # Basic computer info
                             info["basic_info"]["manufacturer"] = "Apple Inc."
                             info["basic_info"]["model"] = item.get("machine_model", "Unknown")
@@ -2024,136 +3428,90 @@ class SystemDiagnosticsServer:
                                 info["system_details"]["cpu_type"] = item.get("cpu_type", "Unknown")
                                 info["system_details"]["number_processors"] = item.get("number_processors", "Unknown")
                                 info["system_details"]["physical_memory"] = item.get("physical_memory", "Unknown")
-                            break
                 except Exception as e:
                     logger.warning(f"Failed to parse system_profiler XML: {e}")
             
-            # Fallback to text format if XML parsing fails
-            if not info["basic_info"]:
-                result = subprocess.run(
-                    ["system_profiler", "SPHardwareDataType"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
+            # Fall back to the text format only when the XML run failed or
+            # couldn't be parsed; a parsed but sparse report won't read
+            # any better as text
+            if not xml_parsed:
+                results = await self._run_commands_async(
+                    {"hardware": ["system_profiler", "SPHardwareDataType"]}, timeout=10
                 )
+                result = results["hardware"]
                 
-                if result.returncode == 0:
+                if result is not None and result.returncode == 0:
                     info["basic_info"]["manufacturer"] = "Apple Inc."
                     
-                    for line in result.stdout.split('\n'):
-                        line = line.strip()
-                        if 'Model Name:' in line:
-                            info["basic_info"]["model"] = line.split(':', 1)[1].strip()
-                        elif 'Model Identifier:' in line:
-                            info["basic_info"]["name"] = line.split(':', 1)[1].strip()
-                            if include_details:
-                                info["system_details"]["model_identifier"] = line.split(':', 1)[1].strip()
-                        elif include_details:
-                            if 'Serial Number:' in line:
-                                info["system_details"]["serial_number"] = line.split(':', 1)[1].strip()
-                            elif 'Hardware UUID:' in line:
-                                info["system_details"]["hardware_uuid"] = line.split(':', 1)[1].strip()
-                            elif 'Boot ROM Version:' in line:
-                                info["system_details"]["boot_rom_version"] = line.split(':', 1)[1].strip()
-                            elif 'SMC Version:' in line:
-                                info["system_details"]["smc_version"] = line.split(':', 1)[1].strip()
-                            elif 'Processor Name:' in line:
-                                info["system_details"]["cpu_type"] = line.split(':', 1)[1].strip()
-                            elif 'Number of Processors:' in line:
-                                info["system_details"]["number_processors"] = line.split(':', 1)[1].strip()
-                            elif 'Memory:' in line:
-                                info["system_details"]["physical_memory"] = line.split(':', 1)[1].strip()
+                    fields = _text_fields(result.stdout, MAC_HARDWARE_KEYS, MAC_HARDWARE_DETAIL_KEYS)
+                    info["basic_info"].update(_pick_fields(fields, MAC_HARDWARE_KEYS))
+                    if include_details:
+                        info["system_details"].update(_pick_fields(fields, MAC_HARDWARE_DETAIL_KEYS))
             
         except Exception as e:
             logger.error(f"Error getting macOS computer model: {e}")
         
         return info
     
-    def _get_linux_computer_model(self, include_details: bool) -> Dict[str, Any]:
-        """Get Linux computer model using dmidecode and /sys/devices fallback"""
-        info = {
-            "basic_info": {},
-            "system_details": {}
-        }
+    def _dmidecode_command(self) -> Optional[List[str]]:
+        """The command prefix that runs dmidecode here, or None when it can't run
         
+        Probed once: dmidecode itself when running as root, otherwise
+        passwordless sudo if it works. A failing sudo -n still costs a
+        fork and exec on every call, so its absence is remembered too.
+        """
+        return self._cached("dmidecode_command", None, self._probe_dmidecode)
+    
+    @staticmethod
+    def _probe_dmidecode() -> Optional[List[str]]:
+        """Find a working way to run dmidecode (see _dmidecode_command)"""
+        if os.geteuid() == 0:
+            return ["dmidecode"] if shutil.which("dmidecode") else None
+        if shutil.which("sudo") is None:
+            return None
         try:
-            # Try dmidecode first (requires sudo for full access)
             result = subprocess.run(
-                ["sudo", "-n", "dmidecode", "-t", "system"],
+                ["sudo", "-n", "dmidecode", "-s", "system-manufacturer"],
                 capture_output=True,
-                text=True
+                timeout=2
             )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return ["sudo", "-n", "dmidecode"] if result.returncode == 0 else None
+    
+    async def _get_linux_computer_model(self, include_details: bool) -> Dict[str, Any]:
+        """Get Linux computer model from /sys/devices, with dmidecode filling the gaps"""
+        info = {section: {} for section in COMPUTER_MODEL_SECTIONS}
+        
+        try:
+            # The kernel's /sys copies of the DMI strings need no process;
+            # only the serial number and UUID there are root-only
+            info["basic_info"].update(self._read_dmi_id(DMI_ID_SYSTEM_FILES))
+            if include_details:
+                info["system_details"].update(self._read_dmi_id(DMI_ID_SYSTEM_DETAIL_FILES))
             
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    line = line.strip()
-                    if 'Manufacturer:' in line:
-                        info["basic_info"]["manufacturer"] = line.split(':', 1)[1].strip()
-                    elif 'Product Name:' in line:
-                        info["basic_info"]["model"] = line.split(':', 1)[1].strip()
-                    elif 'Version:' in line:
-                        info["basic_info"]["name"] = line.split(':', 1)[1].strip()
-                    elif include_details:
-                        if 'Serial Number:' in line:
-                            info["system_details"]["serial_number"] = line.split(':', 1)[1].strip()
-                        elif 'UUID:' in line:
-                            info["system_details"]["uuid"] = line.split(':', 1)[1].strip()
-                        elif 'SKU Number:' in line:
-                            info["system_details"]["sku_number"] = line.split(':', 1)[1].strip()
-                        elif 'Family:' in line:
-                            info["system_details"]["family"] = line.split(':', 1)[1].strip()
-            
-            # If dmidecode didn't work or didn't provide enough info, try /sys/devices fallback
-            if not info["basic_info"]:
-                sys_paths = {
-                    "manufacturer": "/sys/devices/virtual/dmi/id/sys_vendor",
-                    "model": "/sys/devices/virtual/dmi/id/product_name",
-                    "name": "/sys/devices/virtual/dmi/id/product_version",
-                    "serial_number": "/sys/devices/virtual/dmi/id/product_serial",
-                    "uuid": "/sys/devices/virtual/dmi/id/product_uuid",
-                    "sku_number": "/sys/devices/virtual/dmi/id/product_sku",
-                    "family": "/sys/devices/virtual/dmi/id/product_family"
-                }
-                
-                for key, path in sys_paths.items():
-                    if os.path.exists(path):
-                        try:
-                            with open(path, 'r') as f:
-                                value = f.read().strip()
-                                if value and value != "Not Specified":
-                                    if key in ["manufacturer", "model", "name"]:
-                                        info["basic_info"][key] = value
-                                    elif include_details:
-                                        info["system_details"][key] = value
-                        except:
-                            pass
-            
-            # Get additional system information if available
+            # Run dmidecode (when it can run at all) only for what /sys
+            # couldn't provide, without overriding what it did
+            missing = not info["basic_info"] or (
+                include_details and not {"serial_number", "uuid"} <= info["system_details"].keys()
+            )
+            dmidecode = await self._run_blocking(self._dmidecode_command) if missing else None
+            if dmidecode is not None:
+                results = await self._run_commands_async({"system": dmidecode + ["-t", "system"]})
+                result = results["system"]
+                if result is not None and result.returncode == 0:
+                    fields = _text_fields(result.stdout, DMI_SYSTEM_KEYS, DMI_SYSTEM_DETAIL_KEYS)
+                    for key, value in _pick_fields(fields, DMI_SYSTEM_KEYS).items():
+                        info["basic_info"].setdefault(key, value)
+                    if include_details:
+                        for key, value in _pick_fields(fields, DMI_SYSTEM_DETAIL_KEYS).items():
+                            info["system_details"].setdefault(key, value)
+            
+            # Get additional system information if available; the hostname
+            # was read at startup, the release details once per process
             if include_details:
-                # Try to get hostname
-                try:
-                    with open('/proc/sys/kernel/hostname', 'r') as f:
-                        info["system_details"]["hostname"] = f.read().strip()
-                except:
-                    pass
-                
-                # Try to get kernel version
-                try:
-                    with open('/proc/version', 'r') as f:
-                        info["system_details"]["kernel_version"] = f.read().strip()
-                except:
-                    pass
-                
-                # Try to get distribution information
-                try:
-                    if os.path.exists('/etc/os-release'):
-                        with open('/etc/os-release', 'r') as f:
-                            for line in f:
-                                if line.startswith('PRETTY_NAME='):
-                                    info["system_details"]["distribution"] = line.split('=', 1)[1].strip().strip('"')
-                                    break
-                except:
-                    pass
+                info["system_details"]["hostname"] = self._static_info.hostname
+                info["system_details"].update(_linux_release())
             
         except Exception as e:
             logger.error(f"Error getting Linux computer model: {e}")
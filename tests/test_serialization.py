@@ -0,0 +1,25 @@
+"""Tests for the JSON serialization helpers"""
+
+import json
+
+from system_diagnostics_mcp.serialization import dumps, loads
+
+
+def test_dumps_matches_stdlib_indentation():
+    """Indented output is identical to json.dumps(indent=2)"""
+    payload = {"cpu": {"usage_percent": 12.5, "cores": [1, 2]}, "name": "héllo"}
+    assert dumps(payload) == json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def test_dumps_compact_round_trip():
+    """Compact output round-trips through loads"""
+    payload = {"processes": [{"pid": 1, "name": "init"}], "total": 1}
+    text = dumps(payload, indent=False)
+    assert "\n" not in text
+    assert loads(text) == payload
+
+
+def test_dumps_integer_keys():
+    """Integer keys are written as strings, like json.dumps"""
+    payload = {0: 10.0, 1: 20.0}
+    assert loads(dumps(payload)) == {"0": 10.0, "1": 20.0}
@@ -1,15 +1,25 @@
 """Tests for System Diagnostics MCP Server"""
 
 import pytest
+import asyncio
 import json
+import os
 import platform
+import socket
+import struct
 from unittest.mock import Mock, patch
-from system_diagnostics_mcp.server import SystemDiagnosticsServer, SystemInfo
+from system_diagnostics_mcp.server import SystemDiagnosticsServer, SystemInfo, _text_fields
+
+
+@pytest.fixture(scope="session")
+def server():
+    """One server instance shared by the tests, so its caches stay warm"""
+    return SystemDiagnosticsServer()
 
 
 @pytest.fixture
-async def server():
-    """Create a server instance for testing"""
+def fresh_server():
+    """A server instance of its own, for tests that patch what it reads"""
     return SystemDiagnosticsServer()
 
 
@@ -121,10 +131,246 @@ async def test_get_hardware_recommendations(server):
 
 
 @pytest.mark.asyncio
-async def test_error_handling(server):
+async def test_error_handling(fresh_server):
     """Test error handling in server methods"""
     # Test with invalid arguments
-    with patch('psutil.cpu_percent', side_effect=Exception("Test error")):
-        result = await server.get_cpu_metrics({})
+    with patch('psutil.cpu_times', side_effect=Exception("Test error")):
+        result = await fresh_server.get_cpu_metrics({})
         assert len(result) == 1
-        assert "Error:" in result[0].text
\ No newline at end of file
+        assert "Error:" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_failed_handlers_count_as_errors(fresh_server):
+    """Handler failures are counted as errors whatever their message says"""
+    with patch.object(fresh_server, "_computer_model_details", side_effect=Exception("Test error")):
+        result = await fresh_server.get_computer_model({})
+    assert result[0].text.startswith("Error retrieving computer model")
+    assert fresh_server._metrics["get_computer_model.err"] == 1
+    assert fresh_server._metrics["get_computer_model.ok"] == 0
+    
+    await fresh_server.get_system_info({})
+    assert fresh_server._metrics["get_system_info.ok"] == 1
+
+def _write_proc_entry(proc_root, pid, comm, cmdline, ppid=1):
+    """Create /proc/<pid>/stat and cmdline in a fake proc tree"""
+    entry = proc_root / str(pid)
+    entry.mkdir()
+    # state ppid, then zeros up to utime/stime (10, 5), threads (3),
+    # starttime (100) and rss (4 pages)
+    fields = ["S", str(ppid)] + ["0"] * 9 + ["10", "5"] + ["0"] * 4 + ["3", "0", "100", "0", "4"]
+    (entry / "stat").write_bytes(f"{pid} ({comm}) ".encode() + " ".join(fields).encode())
+    (entry / "cmdline").write_bytes(cmdline)
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses os.sysconf")
+def test_linux_process_snapshot_full_names(tmp_path):
+    """Names cut off at 15 characters are completed from argv[0]"""
+    _write_proc_entry(tmp_path, 10, ".anthropic_stdi", b"/opt/bin/.anthropic_stdio_proxy\0--flag\0")
+    _write_proc_entry(tmp_path, 11, "bash", b"-bash\0")
+    _write_proc_entry(tmp_path, 12, "kworker/0:1-eve", b"", ppid=2)
+    _write_proc_entry(tmp_path, 13, "python3 (x) abc", b"/usr/bin/unrelated\0")
+    (tmp_path / "self").mkdir()
+    
+    snapshot = {p["pid"]: p for p in SystemDiagnosticsServer._linux_process_snapshot(str(tmp_path))}
+    assert set(snapshot) == {10, 11, 13}
+    assert snapshot[10]["name"] == ".anthropic_stdio_proxy"
+    assert snapshot[11]["name"] == "bash"
+    # argv[0] that doesn't extend comm is ignored
+    assert snapshot[13]["name"] == "python3 (x) abc"
+    assert snapshot[10]["ticks"] == 15
+    assert snapshot[10]["threads"] == 3
+    assert snapshot[10]["start"] == 100
+
+
+def test_decode_proc_net_address():
+    """/proc/net addresses are decoded from per-word host byte order"""
+    decode = SystemDiagnosticsServer._decode_proc_net_address
+    assert decode("0100007F:0277", socket.AF_INET) == "127.0.0.1:631"
+    assert decode("0101A8C0:01BB", socket.AF_INET) == "192.168.1.1:443"
+    assert decode("00000000000000000000000001000000:0016", socket.AF_INET6) == "::1:22"
+    assert decode("0000000000000000FFFF00000100007F:0050", socket.AF_INET6) == "::ffff:127.0.0.1:80"
+    # Port 0 means there is no address, e.g. the remote end of a listener
+    assert decode("00000000:0000", socket.AF_INET) is None
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses symlinks")
+def test_linux_inet_connections(tmp_path, server):
+    """Rows of a fake /proc/net are mapped to states and owning pids"""
+    header = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n"
+    (tmp_path / "net").mkdir()
+    (tmp_path / "net" / "tcp").write_text(
+        header
+        + "   0: 0100007F:0277 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 111\n"
+        + "   1: 0100007F:A2C4 0100007F:0277 06 00000000:00000000 03:00001234 00000000     0        0 0\n"
+    )
+    (tmp_path / "net" / "udp").write_text(
+        header
+        + "   0: 00000000:0044 00000000:0000 07 00000000:00000000 00:00000000 00000000     0        0 222\n"
+    )
+    fd_dir = tmp_path / "42" / "fd"
+    fd_dir.mkdir(parents=True)
+    os.symlink("socket:[111]", fd_dir / "3")
+    os.symlink("socket:[222]", fd_dir / "4")
+    
+    listening, time_wait, udp = server._linux_inet_connections(10, str(tmp_path))
+    assert listening["status"] == "LISTEN"
+    assert listening["local_address"] == "127.0.0.1:631"
+    assert listening["remote_address"] is None
+    assert listening["pid"] == 42
+    # Orphaned sockets have inode 0 and no owner
+    assert time_wait["status"] == "TIME_WAIT"
+    assert time_wait["pid"] is None
+    # UDP has no connection state
+    assert udp["type"] == "SOCK_DGRAM"
+    assert udp["status"] == "NONE"
+    assert udp["pid"] == 42
+    
+    assert len(server._linux_inet_connections(1, str(tmp_path))) == 1
+
+
+DPKG_STATUS = b"""Package: bash
+Status: install ok installed
+Priority: required
+Version: 5.2.15-2
+Description: GNU Bourne Again SHell
+ Bash is an sh-compatible command language interpreter.
+ Version: not a field, just continuation text
+
+Package: old-tool
+Status: deinstall ok config-files
+Version: 1.0
+Description: Removed, only its config files remain
+
+Package: local-build
+Status: hold ok installed
+Description: Installed without a Version field
+"""
+
+
+def test_linux_applications_from_dpkg_status(tmp_path, fresh_server):
+    """Installed packages are read from dpkg's status file"""
+    status = tmp_path / "status"
+    status.write_bytes(DPKG_STATUS)
+    with patch("system_diagnostics_mcp.server.DPKG_STATUS_PATH", str(status)):
+        applications = fresh_server._get_linux_applications()
+    
+    assert applications == [
+        {"name": "bash", "version": "5.2.15-2", "description": "GNU Bourne Again SHell"},
+        {"name": "local-build", "version": "Unknown", "description": "Installed without a Version field"},
+    ]
+
+
+def _smbios_memory_device(size, speed, strings, locator=1, manufacturer=2, part_number=3,
+                          extended_size=0, form_factor=9, memory_type=26):
+    """A raw SMBIOS 2.8 type 17 structure followed by its string set"""
+    raw = bytearray(0x28)
+    raw[0], raw[1] = 17, 0x28
+    struct.pack_into("<H", raw, 0x0C, size)
+    raw[0x0E] = form_factor
+    raw[0x10] = locator
+    raw[0x12] = memory_type
+    struct.pack_into("<H", raw, 0x15, speed)
+    raw[0x17] = manufacturer
+    raw[0x1A] = part_number
+    struct.pack_into("<I", raw, 0x1C, extended_size)
+    return bytes(raw) + b"\0".join(strings) + b"\0\0"
+
+
+def test_read_smbios_memory_devices(tmp_path):
+    """Memory slots are decoded from raw SMBIOS type 17 records"""
+    records = {
+        # 0x7FFF defers to the 32-bit extended size (MB)
+        "17-0": _smbios_memory_device(0x7FFF, 3200, [b"DIMM_A1", b"Samsung", b"M378A4G43AB2 "],
+                                      extended_size=32768),
+        # Speed 0 is unknown; string index 0 means none and 9 is out of range
+        "17-2": _smbios_memory_device(8192, 0, [b"DIMM_B1"], manufacturer=0, part_number=9,
+                                      form_factor=13, memory_type=99),
+        # Size 0 is an empty slot
+        "17-3": _smbios_memory_device(0, 0, [b"DIMM_B2"]),
+        # Bit 15 gives the size in KB; records are ordered by instance number
+        "17-10": _smbios_memory_device(0x8000 | 16384, 2400, [b"DIMM_C1", b"Kingston", b"KVR"]),
+    }
+    for name, raw in records.items():
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "raw").write_bytes(raw)
+    (tmp_path / "0-0").mkdir()
+    
+    with patch("system_diagnostics_mcp.server.SMBIOS_ENTRIES_DIR", str(tmp_path)):
+        slots = SystemDiagnosticsServer._read_smbios_memory_devices()
+    
+    assert slots == [
+        {"description": "DIMM_A1", "size_gb": 32.0, "speed_mhz": 3200, "manufacturer": "Samsung",
+         "part_number": "M378A4G43AB2", "form_factor": "DIMM", "memory_type": "DDR4"},
+        {"description": "DIMM_B1", "size_gb": 8.0, "speed_mhz": 0, "manufacturer": "Unknown",
+         "part_number": "Unknown", "form_factor": "SODIMM", "memory_type": "Unknown (99)"},
+        {"description": "DIMM_C1", "size_gb": 0.02, "speed_mhz": 2400, "manufacturer": "Kingston",
+         "part_number": "KVR", "form_factor": "DIMM", "memory_type": "DDR4"},
+    ]
+
+
+def test_tail_lines(tmp_path):
+    """The last lines of a file are returned in order"""
+    log = tmp_path / "syslog"
+    log.write_bytes(b"one\ntwo\nthree\n")
+    assert SystemDiagnosticsServer._tail_lines(str(log), 2) == ["two", "three"]
+    # Fewer lines than asked for
+    assert SystemDiagnosticsServer._tail_lines(str(log), 10) == ["one", "two", "three"]
+    assert SystemDiagnosticsServer._tail_lines(str(log), 0) == []
+    
+    # No trailing newline
+    log.write_bytes(b"one\ntwo\nthree")
+    assert SystemDiagnosticsServer._tail_lines(str(log), 2) == ["two", "three"]
+    log.write_bytes(b"only")
+    assert SystemDiagnosticsServer._tail_lines(str(log), 5) == ["only"]
+    
+    log.write_bytes(b"")
+    assert SystemDiagnosticsServer._tail_lines(str(log), 5) == []
+
+
+def test_text_fields():
+    """Only the named "Field: value" lines are picked up, trimmed"""
+    output = (
+        "Hardware Overview:\n"
+        "\n"
+        "      Model Name: MacBook Pro\r\n"
+        "      Serial Number (system): C02XYZ  \n"
+        "      Chip: Apple M2\n"
+        "Manufacturer:\tDell Inc.\n"
+        "Model Name: Later lines win\n"
+    )
+    fields = _text_fields(output, {"Model Name": "model", "Manufacturer": "vendor"},
+                          {"Serial Number": "serial_number", "Serial Number (system)": "serial_number"})
+    assert fields == {
+        "Model Name": "Later lines win",
+        "Serial Number (system)": "C02XYZ",
+        "Manufacturer": "Dell Inc.",
+    }
+
+
+@pytest.mark.asyncio
+async def test_cached_async_shares_inflight_calls(fresh_server):
+    """Concurrent misses share one call; failures are not cached"""
+    calls = []
+    
+    async def compute(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value
+    
+    results = await asyncio.gather(*(
+        fresh_server._cached_async("shared", None, compute, 42) for _ in range(5)
+    ))
+    assert results == [42] * 5
+    assert calls == [42]
+    assert await fresh_server._cached_async("shared", None, compute, 7) == 42
+    
+    async def fail():
+        calls.append("fail")
+        raise RuntimeError("boom")
+    
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await fresh_server._cached_async("failing", None, fail)
+    assert calls.count("fail") == 2
+    assert "failing" not in fresh_server._inflight
@@ -0,0 +1,50 @@
+"""Tests for the Claude Desktop config validation script"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "validate_claude_config.py"
+
+
+@pytest.fixture
+def validator():
+    """The script loaded as a module"""
+    spec = importlib.util.spec_from_file_location("validate_claude_config", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _large_config(servers):
+    """A config document padded past the streaming threshold"""
+    return json.dumps({
+        "mcpServers": servers,
+        "padding": ["x" * 100] * 1000
+    })
+
+
+def test_large_config_streams_mcp_servers(tmp_path, validator):
+    """Configs over the threshold still yield their mcpServers section"""
+    pytest.importorskip("ijson")
+    servers = {"diag": {"command": "python", "args": ["-m", "system_diagnostics_mcp.server"]}}
+    config = tmp_path / "claude_desktop_config.json"
+    config.write_text(_large_config(servers))
+    assert config.stat().st_size > validator._STREAM_THRESHOLD
+    
+    validator._CONFIG_PATH = config
+    assert validator._load_config() == {"mcpServers": servers}
+
+
+def test_large_config_trailing_garbage_rejected(tmp_path, validator):
+    """A syntax error after mcpServers in a large config is still reported"""
+    pytest.importorskip("ijson")
+    config = tmp_path / "claude_desktop_config.json"
+    config.write_text(_large_config({}) + " garbage")
+    
+    validator._CONFIG_PATH = config
+    with pytest.raises(validator._PARSE_ERRORS):
+        validator._load_config()
+    assert validator.validate_claude_config() is False